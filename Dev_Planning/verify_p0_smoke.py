@@ -71,7 +71,7 @@ def test_file_loader_order_and_atomic() -> None:
         # Atomic write failure: ensure no final file created on exception
         final = out_dir / "should_not_exist.txt"
         try:
-            loader._atomic_write_text(final, lambda fh: (_ for _ in ()).throw(RuntimeError("boom")))
+            loader._atomic_write(final, lambda fh: (_ for _ in ()).throw(RuntimeError("boom")))
         except RuntimeError:
             pass
         assert not final.exists(), "Atomic write left a file after failure"
@@ -6,16 +6,147 @@ storing them in a single output file, and generating detailed logs about process
 skipped, and excluded content. Compatible with Windows, Linux, and macOS.
 """
 
+import hashlib
+import json
+import mmap
 import os
+import re
+import sys
 import tempfile
-from typing import Dict, List, Set, Optional, Callable, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Set, Optional, Callable, Any, Tuple, Union
 from pathlib import Path  # For cross-platform path handling
 
-# Default directory names to exclude from traversal
-DEFAULT_EXCLUDE_DIRS: Set[str] = {
+# Default directory names to exclude from traversal. A frozenset so the
+# per-entry membership checks in the walk hit an immutable constant and the
+# default can never be mutated by a caller.
+DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset({
     'venv', '__pycache__', '.venv', 'env', 'node_modules', '.git', '.idea',
     '.tox', 'dist', 'build', '.mypy_cache', '.pytest_cache', 'htmlcov', '.hypothesis', '.coverage'
-}
+})
+
+# Whether files can be opened relative to a directory fd (openat); true on
+# POSIX, false on Windows where dir_fd is unsupported.
+_HAS_DIR_FD: bool = os.open in os.supports_dir_fd
+
+# Matches the record headers written by save_file_contents, for recovering
+# per-file bodies from a previous aggregated output in incremental mode.
+_OUTPUT_HEADER_RE = re.compile(r'^--- File: (.*) ---$', re.MULTILINE)
+
+# Header-name suffix marking a deduplicated record: the body lives under the
+# referenced (earlier) path instead of being written again.
+_DUP_SUFFIX_RE = re.compile(r'^(.*) \(duplicate of (.*)\)$')
+
+
+# Extensions that are effectively always binary. Checked before the file is
+# even opened, so assets cost a string lookup instead of a full read followed
+# by a failed text-detection pass.
+_BINARY_EXTS: frozenset[str] = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico', '.pdf',
+    '.zip', '.gz', '.tar', '.7z',
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.o', '.a', '.pyc', '.wasm',
+    '.mp3', '.mp4', '.mov', '.woff', '.woff2', '.ttf',
+})
+
+# Magic-byte signatures of common binary formats (PNG, JPEG, ZIP, ELF):
+# recognizing these in the first 16 bytes skips reading the rest of the file.
+_BINARY_MAGIC: tuple = (b'\x89PNG', b'\xff\xd8\xff', b'PK\x03\x04', b'\x7fELF')
+
+
+def _looks_binary_head(head: bytes) -> bool:
+    """True if the leading bytes identify a binary file outright."""
+    return head.startswith(_BINARY_MAGIC) or b'\x00' in head
+
+
+# Files larger than this are decoded straight from a read-only memory map
+# instead of a read() copy: the decoder pulls pages from the OS cache on
+# demand and the transient bytes duplicate of the whole body never exists.
+_MMAP_MIN_BYTES: int = 1 << 20
+
+
+def _classify_and_decode(fh, file_path: str) -> Tuple[str, Optional[str], Optional[str], Optional[Exception], bool]:
+    """
+    Shared body of the thread and process read paths: peek for binary magic,
+    read (or map) the remainder, and decode. ``fh`` is a binary file object
+    positioned at the start; returns the usual _load_one result tuple.
+    """
+    head = fh.read(16)
+    if _looks_binary_head(head):
+        return (file_path, None, None, None, True)
+
+    data: Any = None
+    mm: Optional[mmap.mmap] = None
+    try:
+        size = os.fstat(fh.fileno()).st_size
+    except OSError:
+        size = 0
+    if size > _MMAP_MIN_BYTES:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mm = None  # unusual filesystems; fall back to a plain read
+    try:
+        data = mm if mm is not None else head + fh.read()
+        if not FileLoaderTool._is_probably_text(bytes(data[:2048])):
+            return (file_path, None, None, None, True)
+        content, used, err = FileLoaderTool._decode_bytes_with_fallback(data)
+    finally:
+        if mm is not None:
+            mm.close()
+    if content is None:
+        decode_err = OSError(f"Failed to decode text file: {file_path}")
+        decode_err.__cause__ = err
+        return (file_path, None, None, decode_err, False)
+    return (file_path, content, used, None, False)
+
+
+# Above this many total bytes the read/decode fan-out switches from threads
+# to processes: decoding large bodies holds the GIL, so threads stop scaling
+# once the workload is decode-bound rather than latency-bound. Below it, the
+# IPC cost of shipping file bodies between processes outweighs the win.
+_PROCESS_POOL_MIN_BYTES: int = 64 * 1024 * 1024
+
+# Batch size for ProcessPoolExecutor.map: amortizes the per-task pickle and
+# queue round-trip over many small files.
+_PROCESS_POOL_CHUNKSIZE: int = 64
+
+
+def _read_and_decode(file_path: str) -> Tuple[str, Optional[str], Optional[str], Optional[Exception], bool]:
+    """
+    Process-pool worker: read and decode one file.
+
+    Module-level (picklable) counterpart of ``FileLoaderTool._load_one`` with
+    the same result shape; it touches no shared state, so workers need no
+    setup beyond importing this module.
+    """
+    if os.path.splitext(file_path)[1].lower() in _BINARY_EXTS:
+        return (file_path, None, None, None, True)
+    try:
+        with open(FileLoaderTool._safe_fs_path(file_path), 'rb') as fh:
+            return _classify_and_decode(fh, file_path)
+    except (UnicodeDecodeError, FileNotFoundError, PermissionError, OSError) as e:
+        return (file_path, None, None, e, False)
+
+
+def _path_key(path: str) -> str:
+    """
+    Compact cache key for a file path: the first 64 bits of its MD5, hex
+    encoded. MD5 runs in C and the truncated digest keeps the sidecar cache
+    small while making collisions between project paths vanishingly unlikely.
+    """
+    return hashlib.md5(path.encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+
+
+def _body_digest(text: str) -> str:
+    """
+    Short content digest of a decoded file body, stored in the scan cache
+    and re-checked before an incremental run reuses a body recovered from
+    the previous aggregated output. The output format's record headers are
+    plain lines, so a body that happens to contain one mis-splits the
+    parse; the digest turns that from silent corruption into a failed
+    reuse check (the file is simply read from disk again).
+    """
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=8).hexdigest()
 
 
 class FileLoaderTool:
@@ -46,7 +177,9 @@ class FileLoaderTool:
         self.skipped_files: List[str] = []
         self.excluded_dirs: List[str] = []
         self._logger: Callable[[str], None] = logger if logger is not None else print
-        self.exclude_dirs: Set[str] = set(exclude_dirs) if exclude_dirs is not None else set(DEFAULT_EXCLUDE_DIRS)
+        self.exclude_dirs: frozenset[str] = (
+            frozenset(exclude_dirs) if exclude_dirs is not None else DEFAULT_EXCLUDE_DIRS
+        )
 
     def _log(self, message: str, level: str = "INFO") -> None:
         """
@@ -60,18 +193,14 @@ class FileLoaderTool:
             # Fallback to print if provided logger fails
             print(formatted)
 
-    def _is_probably_text(self, file_path: Path, sample_size: int = 2048) -> bool:
+    @staticmethod
+    def _is_probably_text(data: bytes, sample_size: int = 2048) -> bool:
         """
-        Heuristic to detect text vs binary by sampling bytes.
+        Heuristic to detect text vs binary by sampling the leading bytes.
         - Returns False if NUL byte present.
         - Otherwise checks ratio of printable/whitespace bytes.
         """
-        try:
-            with open(self._safe_fs_path(file_path), 'rb') as fh:
-                data = fh.read(sample_size)
-        except OSError:
-            # If we can't read as bytes, treat as non-text to be safe.
-            return False
+        data = data[:sample_size]
         if not data:
             return True
         if b"\x00" in data:
@@ -85,39 +214,58 @@ class FileLoaderTool:
                 controls += 1
         return (controls / max(1, len(data))) <= 0.30
 
-    def _read_text_with_fallback(self, file_path: Path) -> Tuple[Optional[str], Optional[str], Optional[Exception]]:
+    def _open_file(self, file_path: str, name: Optional[str] = None,
+                   dir_fd: Optional[int] = None):
         """
-        Attempt to read text using a sequence of encodings.
-        Returns (text, encoding_used). If it must fall back to replacement,
-        returns ('decoded text', 'fallback-replace:<encoding>'). If it fails,
-        returns (None, None).
+        Open a file for binary reading.
+
+        Decoding happens later from memory instead of re-opening the file
+        once per candidate encoding. When ``name`` and ``dir_fd`` are given
+        the open is done relative to the directory fd (openat), skipping
+        full-path resolution.
+        """
+        if dir_fd is not None and name is not None:
+            fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+            return os.fdopen(fd, 'rb')
+        return open(self._safe_fs_path(file_path), 'rb')
+
+    @staticmethod
+    def _decode_bytes_with_fallback(data: Any) -> Tuple[Optional[str], Optional[str], Optional[Exception]]:
+        """
+        Attempt to decode raw bytes using a sequence of encodings.
+        Accepts any bytes-like object (bytes or an mmap), decoded in place
+        via the str constructor so no intermediate copy is made.
+        Returns (text, encoding_used, error). If it must fall back to
+        replacement, returns ('decoded text', 'fallback-replace:<encoding>').
+        If it fails, returns (None, None, error).
         """
         encodings = ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-16-be', 'cp1252', 'latin-1']
         last_err: Optional[Exception] = None
         for enc in encodings:
             try:
-                with open(self._safe_fs_path(file_path), 'r', encoding=enc, errors='strict') as fh:
-                    return (fh.read(), enc, None)
-            except (UnicodeError, OSError) as e:
+                return (str(data, enc), enc, None)
+            except UnicodeError as e:
                 last_err = e
                 continue
         # Last resort: decode with replacement to avoid crashing the run
         try:
-            with open(self._safe_fs_path(file_path), 'r', encoding='utf-8', errors='replace') as fh:
-                return (fh.read(), 'fallback-replace:utf-8', None)
-        except (UnicodeError, OSError) as e:
+            return (str(data, 'utf-8', 'replace'), 'fallback-replace:utf-8', None)
+        except UnicodeError as e:
             return (None, None, last_err or e)
 
-    def _safe_fs_path(self, p: Path) -> str:
+    @staticmethod
+    def _safe_fs_path(p: Union[str, Path]) -> str:
         r"""
         Return a filesystem-safe string path.
         On Windows, prefix with \\?\ for long absolute paths or convert UNC
-        to \\?\UNC\server\share form.
+        to \\?\UNC\server\share form. Accepts plain strings so hot callers
+        need not allocate Path objects (pathlib arithmetic is several times
+        slower than string handling, and paths are strings downstream anyway).
         """
         s = str(p)
         if os.name != 'nt':
             return s
-        abs_s = str(p.resolve())
+        abs_s = str(Path(s).resolve())
         if abs_s.startswith('\\\\?\\'):
             return abs_s
         if abs_s.startswith('\\\\'):
@@ -142,6 +290,8 @@ class FileLoaderTool:
         directory: str,
         progress_callback: Optional[Callable[[str, int, int, str], None]] = None,
         cancel_event: Optional[Any] = None,
+        cache_file: Optional[str] = None,
+        previous_output: Optional[str] = None,
     ) -> Dict[str, str]:
         """
         Recursively load text files from the given directory and its subdirectories.
@@ -150,82 +300,390 @@ class FileLoaderTool:
         to read all text files. Binary files and files that can't be read are logged
         as skipped. Excluded directories are tracked.
 
+        Materializes everything in memory; for large trees, prefer iterating
+        ``iter_files`` and streaming straight into ``save_file_contents``.
+
         Args:
             directory: The directory path to process.
+            cache_file: Optional incremental-scan cache path (see ``iter_files``).
+            previous_output: Optional prior aggregated output to reuse content
+                from when the cache says a file is unchanged.
 
         Returns:
             A dictionary mapping file paths to their text contents.
         """
         file_contents: Dict[str, str] = {}
-        
+        for file_path, content in self.iter_files(directory, progress_callback, cancel_event,
+                                                  cache_file=cache_file,
+                                                  previous_output=previous_output):
+            file_contents[file_path] = content
+        return file_contents
+
+    def iter_files(
+        self,
+        directory: str,
+        progress_callback: Optional[Callable[[str, int, int, str], None]] = None,
+        cancel_event: Optional[Any] = None,
+        cache_file: Optional[str] = None,
+        previous_output: Optional[str] = None,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Lazily yield ``(path, text)`` for each readable text file under
+        ``directory``.
+
+        This is the streaming core of the loader: files are submitted to the
+        pool one directory group at a time, so a consumer that writes results
+        straight to disk bounds peak memory at one directory's worth of
+        decoded bodies (workers complete futures whether or not the consumer
+        has caught up). Skip/exclusion bookkeeping and logging behave exactly
+        as in ``load_files_in_directory``.
+
+        When both ``cache_file`` and ``previous_output`` are given, the run is
+        incremental: files whose ``(mtime_ns, size)`` signature matches the
+        cache written by the previous run — and whose recovered body matches
+        the content digest stored alongside it — are served from the previous
+        aggregated output (one sequential read) instead of being re-opened,
+        which makes repeat scans of mostly unchanged trees cheap. A fresh
+        cache is written when the run completes.
+        """
         directory_path = Path(directory).resolve()
-        
+
+        # Incremental mode: hydrate the signature cache and the previous
+        # run's contents. Both are required — signatures alone cannot supply
+        # the file bodies.
+        cache_entries: Dict[str, List[Any]] = {}
+        prev_contents: Dict[str, str] = {}
+        use_cache = cache_file is not None
+        if use_cache and previous_output is not None:
+            cache_entries = self._load_scan_cache(cache_file)
+            if cache_entries:
+                prev_contents = self._parse_previous_output(previous_output)
+                if not prev_contents:
+                    cache_entries = {}
+        new_cache: Dict[str, List[Any]] = {}
+        reused_count = 0
+
+        # The walk prunes excluded directories before descending, so ancestry
+        # only needs checking once for the starting directory itself (e.g. a
+        # scan pointed directly inside node_modules).
+        if any(part in self.exclude_dirs for part in directory_path.parts):
+            self._log(f"Directory is excluded from processing: {directory_path}", level="INFO")
+            return
+
         processed_count = 0
         total_estimate = 0  # 0/negative implies unknown
 
-        for root, dirs, files in os.walk(directory_path):
-            root_path = Path(root)
-            
-            # Track and remove excluded directories
-            removed_dirs = set(d for d in dirs if d in self.exclude_dirs)
-            if removed_dirs:
-                self.excluded_dirs.extend(str(root_path / d) for d in removed_dirs)
-            
-            # Update dirs in place to exclude unwanted directories
-            dirs[:] = [d for d in dirs if d not in self.exclude_dirs]
-            # Deterministic traversal order: sort directories (case-insensitive)
-            dirs.sort(key=lambda s: s.casefold())
-            
-            # Skip processing if the current directory is in an excluded path
-            if any(ex_dir in root_path.parts for ex_dir in self.exclude_dirs):
-                continue
+        # Per-run bookkeeping is accumulated in locals and flushed to the
+        # instance lists once on the way out (including early exits), so the
+        # hot loops avoid an attribute load + method call per file.
+        processed_local: List[str] = []
+        skipped_local: List[str] = []
+        excluded_local: List[str] = []
 
-            # Deterministic file order within a directory
-            for file in sorted(files, key=lambda s: s.casefold()):
-                file_path = root_path / file
+        # Per-file diagnostics are collected here and emitted as one _log
+        # call per level on the way out: with a print/stdout logger each call
+        # can mean a flush, and on asset-heavy trees thousands of skip
+        # messages would otherwise dominate wall time.
+        deferred_warnings: List[str] = []
+        deferred_errors: List[str] = []
+
+        try:
+            # Explicit scandir stack instead of os.walk: os.walk discards the
+            # DirEntry objects, forcing a second stat per file downstream. Keeping
+            # the entries lets type checks come from the cached scandir data.
+            stack: List[str] = [str(directory_path)]
+            file_groups: List[Tuple[str, List[os.DirEntry]]] = []
+            total_files = 0
+            total_bytes = 0
+            while stack:
                 if cancel_event is not None and getattr(cancel_event, 'is_set', lambda: False)():
-                    return file_contents
+                    return
+                root = stack.pop()
+
+                subdirs: List[os.DirEntry] = []
+                file_entries: List[os.DirEntry] = []
                 try:
-                    # Skip likely binary files early
-                    if not self._is_probably_text(file_path):
-                        msg = f"Skipped (binary) {file_path}"
-                        self.skipped_files.append(msg)
-                        self._log(msg, level="WARNING")
-                        processed_count += 1
-                        if progress_callback is not None:
-                            progress_callback('file_loader', processed_count, total_estimate, str(root_path))
-                        continue
-                    # Attempt to read using encoding fallback strategy
-                    content, used, err = self._read_text_with_fallback(file_path)
-                    if content is None:
-                        # Treat as an I/O-style failure so it's handled
-                        # by the outer OSError block and logged/skipped.
-                        raise OSError(f"Failed to decode text file: {file_path}") from err
-                    file_contents[str(file_path)] = content
-                    self.processed_files.append(str(file_path))
-                    processed_count += 1
-                    if progress_callback is not None:
-                        progress_callback('file_loader', processed_count, total_estimate, str(root_path))
-                    if used and used.startswith('fallback-replace'):
-                        self._log(f"Decoded with replacement: {file_path} ({used})", level="WARNING")
-                except (UnicodeDecodeError, FileNotFoundError, PermissionError, OSError) as e:
-                    path_too_long = isinstance(e, OSError) and self._is_path_too_long_error(e)
-                    if path_too_long:
-                        error_msg = f"Skipped (path too long) {file_path}"
-                    else:
-                        error_msg = f"Skipped {file_path} due to error: {e}"
-                    self.skipped_files.append(error_msg)
-                    level = "ERROR" if isinstance(e, OSError) and not path_too_long else "WARNING"
-                    self._log(error_msg, level=level)
-                    processed_count += 1
-                    if progress_callback is not None:
-                        progress_callback('file_loader', processed_count, total_estimate, str(root_path))
-        
-        return file_contents
+                    with os.scandir(root) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry)
+                                elif not entry.is_dir():
+                                    # Regular files, symlinks to files, and broken
+                                    # symlinks (read attempt below will log those);
+                                    # symlinked directories are ignored, matching
+                                    # os.walk's no-follow behavior.
+                                    file_entries.append(entry)
+                            except OSError:
+                                # Entry type could not be determined; skip it.
+                                continue
+                except OSError as e:
+                    msg = f"Skipped {root} due to error: {e}"
+                    skipped_local.append(msg)
+                    deferred_errors.append(msg)
+                    continue
+
+                # Track excluded directories, then push the rest in reverse sorted
+                # order so the stack pops them in deterministic (case-insensitive)
+                # ascending order.
+                for d in subdirs:
+                    if d.name in self.exclude_dirs:
+                        excluded_local.append(d.path)
+                subdirs = [d for d in subdirs if d.name not in self.exclude_dirs]
+                subdirs.sort(key=lambda e: e.name.casefold(), reverse=True)
+                stack.extend(d.path for d in subdirs)
+
+                # Deterministic file order within a directory
+                file_entries.sort(key=lambda e: e.name.casefold())
+                if file_entries:
+                    file_groups.append((root, file_entries))
+                    total_files += len(file_entries)
+                    # Size up the workload while the entries are at hand; the
+                    # stat result is cached on the DirEntry, so later callers
+                    # (incremental signatures) pay nothing extra.
+                    for fe in file_entries:
+                        try:
+                            total_bytes += fe.stat().st_size
+                        except OSError:
+                            pass
+
+            # Phase 2: read and decode files on a small thread pool. The reads are
+            # latency-bound, so a handful of in-flight requests keeps the storage
+            # queue busy; results arrive in submission order so output stays
+            # deterministic. All bookkeeping/logging happens on the calling thread.
+            # Files are read one directory group at a time: where the platform
+            # supports it, the directory is opened once and files are opened
+            # relative to that fd (openat), so the kernel resolves a single path
+            # component per file instead of the full path from the root.
+            if not file_groups:
+                return
+
+            # The walk counted the files, so progress can be determinate.
+            total_estimate = total_files
+
+            max_workers = min(8, (os.cpu_count() or 4))
+            # WASM builds (Pyodide in the webapp) cannot start threads or
+            # processes — the first submit would raise "can't start new
+            # thread" — so files are read in-line on the calling thread
+            # there. The sequential generator below follows the same
+            # iteration protocol as executor.map.
+            can_spawn = sys.platform not in ("emscripten", "wasi")
+            # Decode-bound workloads (many megabytes of bodies) fan out to
+            # processes so UTF-8 decoding runs outside the GIL; small trees
+            # stay on threads, where reads are latency-bound and the IPC cost
+            # of shipping bodies between processes would dominate.
+            use_processes = can_spawn and total_bytes > _PROCESS_POOL_MIN_BYTES
+            executor: Optional[Any] = None
+            if use_processes:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            elif can_spawn:
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                for root, entries in file_groups:
+                    # Partition this directory's files into cache hits (body
+                    # reused from the previous output) and files that must be
+                    # read; the merge below preserves the sorted order.
+                    reused: Dict[str, str] = {}
+                    to_read = entries
+                    if cache_entries:
+                        to_read = []
+                        for e in entries:
+                            sig = cache_entries.get(_path_key(e.path))
+                            if sig is not None and e.path in prev_contents:
+                                try:
+                                    st = e.stat()
+                                except OSError:
+                                    to_read.append(e)
+                                    continue
+                                # The stat signature says the file on disk is
+                                # unchanged; the digest says the body recovered
+                                # from the previous output is the one that was
+                                # written (a header-like line inside a body
+                                # mis-splits the parse). Both must hold.
+                                body = prev_contents[e.path]
+                                if (len(sig) == 3
+                                        and sig[0] == st.st_mtime_ns
+                                        and sig[1] == st.st_size
+                                        and sig[2] == _body_digest(body)):
+                                    reused[e.path] = body
+                                    continue
+                            to_read.append(e)
+
+                    dir_fd: Optional[int] = None
+                    if _HAS_DIR_FD and to_read and not use_processes:
+                        try:
+                            dir_fd = os.open(root, os.O_RDONLY)
+                        except OSError:
+                            dir_fd = None  # fall back to full-path opens
+                    try:
+                        if use_processes:
+                            # fds don't cross process boundaries; workers open
+                            # by full path and chunking amortizes the per-task
+                            # pickle round-trip over many small files.
+                            results = executor.map(_read_and_decode,
+                                                   [e.path for e in to_read],
+                                                   chunksize=_PROCESS_POOL_CHUNKSIZE)
+                        elif executor is not None:
+                            results = executor.map(lambda e: self._load_one(e, dir_fd), to_read)
+                        else:
+                            results = (self._load_one(e, dir_fd) for e in to_read)
+                        for entry in entries:
+                            if entry.path in reused:
+                                file_path = entry.path
+                                content: Optional[str] = reused[file_path]
+                                used = err = None
+                                is_binary = False
+                                reused_count += 1
+                            else:
+                                file_path, content, used, err, is_binary = next(results)
+                            if cancel_event is not None and getattr(cancel_event, 'is_set', lambda: False)():
+                                return
+                            processed_count += 1
+                            if is_binary:
+                                msg = f"Skipped (binary) {file_path}"
+                                skipped_local.append(msg)
+                                deferred_warnings.append(msg)
+                            elif err is not None:
+                                path_too_long = isinstance(err, OSError) and self._is_path_too_long_error(err)
+                                if path_too_long:
+                                    error_msg = f"Skipped (path too long) {file_path}"
+                                else:
+                                    error_msg = f"Skipped {file_path} due to error: {err}"
+                                skipped_local.append(error_msg)
+                                if isinstance(err, OSError) and not path_too_long:
+                                    deferred_errors.append(error_msg)
+                                else:
+                                    deferred_warnings.append(error_msg)
+                            else:
+                                # Record before yielding so a consumer that
+                                # stops early still sees this file accounted.
+                                processed_local.append(file_path)
+                                if used and used.startswith('fallback-replace'):
+                                    deferred_warnings.append(f"Decoded with replacement: {file_path} ({used})")
+                                if use_cache:
+                                    try:
+                                        st = entry.stat()
+                                        new_cache[_path_key(file_path)] = [
+                                            st.st_mtime_ns, st.st_size, _body_digest(content)
+                                        ]
+                                    except OSError:
+                                        pass
+                                yield (file_path, content)
+                            if progress_callback is not None:
+                                progress_callback('file_loader', processed_count, total_estimate, root)
+                    finally:
+                        if dir_fd is not None:
+                            os.close(dir_fd)
+
+                # The run completed (not cancelled/abandoned): persist the
+                # fresh signatures for the next incremental scan.
+                if use_cache:
+                    self._save_scan_cache(cache_file, new_cache)
+                    if reused_count:
+                        self._log(f"Incremental scan reused {reused_count} unchanged files", level="INFO")
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+        finally:
+            self.processed_files.extend(processed_local)
+            self.skipped_files.extend(skipped_local)
+            self.excluded_dirs.extend(excluded_local)
+            # One multi-line message per level; the UI log pane splits lines,
+            # so rendering is unchanged while flushes drop to at most two.
+            if deferred_warnings:
+                self._log('\n'.join(deferred_warnings), level="WARNING")
+            if deferred_errors:
+                self._log('\n'.join(deferred_errors), level="ERROR")
+
+    def _load_one(self, entry: os.DirEntry,
+                  dir_fd: Optional[int] = None) -> Tuple[str, Optional[str], Optional[str], Optional[Exception], bool]:
+        """
+        Read and decode a single file; runs on a worker thread.
+
+        Returns (path, content, encoding_used, error, is_binary). Exactly one
+        of content/error/is_binary describes the outcome; no shared state is
+        touched here so the pool needs no locking. ``dir_fd`` is an open fd
+        for the file's directory (POSIX only); the full path is kept for
+        logging but never used for I/O when the fd is available.
+        """
+        file_path = entry.path
+        # Cheapest checks first: a blacklisted extension skips the open
+        # entirely, and a recognized binary magic number in the first 16
+        # bytes skips reading the rest of the file.
+        if os.path.splitext(entry.name)[1].lower() in _BINARY_EXTS:
+            return (file_path, None, None, None, True)
+        try:
+            with self._open_file(file_path, name=entry.name, dir_fd=dir_fd) as fh:
+                return _classify_and_decode(fh, file_path)
+        except (UnicodeDecodeError, FileNotFoundError, PermissionError, OSError) as e:
+            return (file_path, None, None, e, False)
+
+    def _load_scan_cache(self, cache_file: str) -> Dict[str, List[Any]]:
+        """
+        Load the incremental-scan sidecar cache: a JSON mapping of hashed
+        path -> [mtime_ns, size, body_digest]. Any problem (missing file,
+        bad JSON, unknown version — including hashless version-1 caches)
+        simply disables reuse for this run.
+        """
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as fh:
+                data = json.load(fh)
+            if isinstance(data, dict) and data.get('version') == 2:
+                entries = data.get('entries')
+                if isinstance(entries, dict):
+                    return entries
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _save_scan_cache(self, cache_file: str, entries: Dict[str, List[Any]]) -> None:
+        """Persist the incremental-scan cache; best effort, failures logged."""
+        cache_path = Path(cache_file)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(
+                cache_path,
+                lambda fh: json.dump({'version': 2, 'entries': entries}, fh)
+            )
+        except Exception as e:
+            self._log(f"Failed to write scan cache {cache_file}: {e}", level="WARNING")
+
+    def _parse_previous_output(self, output_file: str) -> Dict[str, str]:
+        """
+        Recover per-file bodies from a previous aggregated output with one
+        sequential read. Returns {} if the file is missing or unparsable.
+        File bodies containing a line that looks like a record header
+        mis-split here; the body digest stored in the scan cache catches
+        that at reuse time, so such files fail the reuse check and are
+        read from disk as usual.
+        """
+        try:
+            with open(output_file, 'r', encoding='utf-8') as fh:
+                text = fh.read()
+        except OSError:
+            return {}
+        contents: Dict[str, str] = {}
+        matches = list(_OUTPUT_HEADER_RE.finditer(text))
+        for i, m in enumerate(matches):
+            name = m.group(1)
+            # Dedup markers carry no body; resolve them against the
+            # referenced record, which always appears earlier in the file.
+            dup = _DUP_SUFFIX_RE.match(name)
+            if dup is not None and dup.group(2) in contents:
+                contents[dup.group(1)] = contents[dup.group(2)]
+                continue
+            start = m.end() + 1  # skip the newline after the header
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            # Each record is written as content + "\n\n"
+            body = text[start:end]
+            if body.endswith('\n\n'):
+                body = body[:-2]
+            contents[name] = body
+        return contents
 
     def save_file_contents(
-        self, 
-        file_contents: Dict[str, str], 
+        self,
+        file_contents: Union[Dict[str, str], Iterable[Tuple[str, str]]],
         output_file: str = 'Tools_Outputs/loaded_files_output.txt'
     ) -> None:
         """
@@ -235,22 +693,48 @@ class FileLoaderTool:
         contents with clear separators between files.
 
         Args:
-            file_contents: Dictionary mapping file paths to their contents.
+            file_contents: Dictionary mapping file paths to their contents, or
+                an iterable of ``(path, content)`` pairs (e.g. ``iter_files``).
+                A dict is written sorted by path; an iterable is streamed to
+                disk in arrival order so only one file body is held in memory
+                at a time.
             output_file: Path where the aggregated content should be saved.
         """
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Deterministic order by path
-        sorted_paths = sorted(file_contents.keys(), key=lambda s: s.casefold())
+        if isinstance(file_contents, dict):
+            # Deterministic order by path
+            records: Iterable[Tuple[str, str]] = sorted(
+                file_contents.items(), key=lambda kv: kv[0].casefold()
+            )
+        else:
+            records = file_contents
 
         def _write(fh):
-            for file_path in sorted_paths:
-                content = file_contents[file_path]
-                fh.write(f"--- File: {file_path} ---\n")
-                fh.write(content + "\n\n")
-
-        self._atomic_write_text(output_path, _write)
+            # Repeat bodies (vendored trees, generated files, license copies)
+            # are written once; later sightings get a marker pointing at the
+            # first path. BLAKE2b runs in C and a 128-bit digest makes
+            # accidental collisions a non-concern.
+            seen: Dict[bytes, str] = {}
+            # Binary writelines: the header, body, and separator go to the
+            # file object as separate buffers, so no `content + "\n\n"` copy
+            # of a potentially multi-megabyte body is ever allocated.
+            for file_path, content in records:
+                body = content.encode('utf-8')
+                digest = hashlib.blake2b(body, digest_size=16).digest()
+                original = seen.get(digest)
+                if original is not None:
+                    fh.write(f"--- File: {file_path} (duplicate of {original}) ---\n\n".encode('utf-8'))
+                    continue
+                seen[digest] = file_path
+                fh.writelines((
+                    f"--- File: {file_path} ---\n".encode('utf-8'),
+                    body,
+                    b"\n\n",
+                ))
+
+        self._atomic_write(output_path, _write, binary=True)
         self._log(f"File contents saved to {output_path}", level="INFO")
 
     def save_log(
@@ -292,20 +776,30 @@ class FileLoaderTool:
             else:
                 fh.write("No files were skipped during processing\n")
 
-        self._atomic_write_text(log_path, _write)
+        self._atomic_write(log_path, _write)
         self._log(f"Log saved to {log_path}", level="INFO")
 
-    def _atomic_write_text(self, final_path: Path, write_callback: Callable[[Any], None]) -> None:
+    def _atomic_write(self, final_path: Path, write_callback: Callable[[Any], None],
+                      binary: bool = False) -> None:
         """
-        Atomically write text to final_path by writing to a temp file and replacing.
+        Atomically write to final_path by writing to a temp file and replacing.
         Ensures best-effort atomicity across platforms using os.replace.
+
+        With ``binary=True`` the callback receives a binary file object with a
+        large (4 MiB) write buffer — the aggregated-output path writes many
+        small headers between large bodies, and the big buffer turns those
+        into few large sequential writes.
         """
         tmp_dir = final_path.parent
         prefix = final_path.name + "."
         fd, tmp_name = tempfile.mkstemp(prefix=prefix, suffix=".tmp", dir=str(tmp_dir))
         tmp_path = Path(tmp_name)
         try:
-            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as fh:
+            if binary:
+                fh_ctx = os.fdopen(fd, 'wb', buffering=4 * 1024 * 1024)
+            else:
+                fh_ctx = os.fdopen(fd, 'w', encoding='utf-8', newline='')
+            with fh_ctx as fh:
                 write_callback(fh)
                 fh.flush()
                 try:
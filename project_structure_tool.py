@@ -8,16 +8,59 @@ the nested directory structure. Works across Windows, Linux, and macOS.
 
 import os
 import json
-import datetime
 import platform
 import stat
-from typing import Dict, Any, List, TypedDict, Optional, Callable
-
-# Default directory names to exclude from traversal
-DEFAULT_EXCLUDE_DIRS: set[str] = {
+import time
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Tuple, TypedDict, Optional, Callable
+
+# Optional C-accelerated JSON writer (install via the 'fast' extra). The
+# stdlib json module remains the fallback so the core tools stay
+# dependency-free.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming JSON parser (also via the 'fast' extra). Lets
+# iter_files walk huge saved structures without materializing the whole
+# nested dict; without it the iterator falls back to a plain json.load.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Default directory names to exclude from traversal. A frozenset so the
+# per-entry membership checks in the walk hit an immutable constant and the
+# default can never be mutated by a caller.
+DEFAULT_EXCLUDE_DIRS: frozenset[str] = frozenset({
     'venv', '__pycache__', '.venv', 'env', 'node_modules', '.git', '.idea',
     '.tox', 'dist', 'build', '.mypy_cache', '.pytest_cache', 'htmlcov', '.hypothesis', '.coverage'
-}
+})
+
+# Unix permission bits paired with their rwx characters, in display order.
+# Precomputed once so the per-file permission string needs no getattr or
+# format-string work.
+_PERM_BITS: tuple = (
+    stat.S_IRUSR, stat.S_IWUSR, stat.S_IXUSR,
+    stat.S_IRGRP, stat.S_IWGRP, stat.S_IXGRP,
+    stat.S_IROTH, stat.S_IWOTH, stat.S_IXOTH,
+)
+_PERM_CHARS: str = 'rwxrwxrwx'
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(ts_int: int) -> str:
+    """
+    Format a second-truncated Unix timestamp as ``YYYY-MM-DD HH:MM:SS``.
+
+    Cached because files written by the same build or checkout share
+    timestamps down to the second, so on real trees most calls are repeat
+    hits that skip the localtime conversion and formatting entirely.
+    """
+    tm = time.localtime(ts_int)
+    return (f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d} "
+            f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}")
 
 class FileInfo(TypedDict):
     """Type definition for file metadata"""
@@ -57,7 +100,22 @@ class ProjectStructureTool:
         self.project_map: Dict[str, DirectoryStructure] = {}
         self.system: str = platform.system().lower()
         self._logger: Callable[[str], None] = logger if logger is not None else print
-        self.exclude_dirs: set[str] = set(exclude_dirs) if exclude_dirs is not None else set(DEFAULT_EXCLUDE_DIRS)
+        self.exclude_dirs: frozenset[str] = (
+            frozenset(exclude_dirs) if exclude_dirs is not None else DEFAULT_EXCLUDE_DIRS
+        )
+        # Bind the platform-appropriate metadata helpers once, instead of
+        # re-testing self.system per file inside the walk. On Linux (where
+        # creation time isn't reliably available) the bound helper is a
+        # trivial constant-None function.
+        if self.system == 'windows':
+            self._get_file_creation_time = self._ctime_windows
+            self._get_file_permissions = self._perms_windows
+        elif self.system == 'darwin':
+            self._get_file_creation_time = self._ctime_darwin
+            self._get_file_permissions = self._perms_unix
+        else:
+            self._get_file_creation_time = self._ctime_none
+            self._get_file_permissions = self._perms_unix
 
     def _log(self, message: str, level: str = "INFO") -> None:
         formatted = f"[{level.upper()}] {message}"
@@ -69,14 +127,30 @@ class ProjectStructureTool:
     def _count_items(self, root_path: str) -> int:
         """
         Count total items (files + directories) under root_path for progress reporting.
+        Prunes excluded directories so the count matches what the build will
+        actually visit (and so the pre-pass doesn't walk node_modules-sized
+        trees the build then skips). Uses a scandir stack like the build
+        itself: entry types come from the cached DirEntry data, so the
+        pre-pass costs one getdents sweep rather than a stat per entry.
         Returns 0 if counting fails; callers may fall back to indeterminate progress.
         """
         total = 0
-        try:
-            for _root, dirs, files in os.walk(root_path):
-                total += len(dirs) + len(files)
-        except OSError:
-            return 0
+        stack = [root_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        total += 1
+                        try:
+                            if (entry.is_dir(follow_symlinks=False)
+                                    and entry.name not in self.exclude_dirs):
+                                stack.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                # Unreadable directory: skip it, as os.walk used to.
+                continue
         return total
 
     def _format_datetime(self, timestamp: float) -> str:
@@ -89,69 +163,61 @@ class ProjectStructureTool:
         Returns:
             str: Formatted datetime string (YYYY-MM-DD HH:MM:SS)
         """
-        return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        return _format_timestamp(int(timestamp))
 
-    def _get_file_creation_time(self, path: str) -> Optional[str]:
-        """
-        Get file creation time in a cross-platform way.
-
-        Args:
-            path (str): Path to the file
+    # Creation-time helpers. __init__ binds the right one for the host
+    # platform to self._get_file_creation_time; they share the
+    # (stats, path) signature so callers stay platform-agnostic.
 
-        Returns:
-            Optional[str]: Formatted creation time or None if unavailable
-        """
+    def _ctime_windows(self, stats: os.stat_result, path: str) -> Optional[str]:
+        """Windows reports creation time via st_ctime."""
         try:
-            if self.system == 'windows':
-                # Windows provides actual creation time
-                return self._format_datetime(os.path.getctime(path))
-            elif self.system == 'darwin':  # macOS
-                # macOS has birth time (creation time)
-                stat_info = os.stat(path)
-                if hasattr(stat_info, 'st_birthtime'):
-                    return self._format_datetime(stat_info.st_birthtime)
-            # On Linux, creation time isn't reliably available
+            return self._format_datetime(stats.st_ctime)
+        except (OSError, AttributeError):
             return None
+
+    def _ctime_darwin(self, stats: os.stat_result, path: str) -> Optional[str]:
+        """macOS has birth time (creation time) as st_birthtime."""
+        try:
+            if hasattr(stats, 'st_birthtime'):
+                return self._format_datetime(stats.st_birthtime)
+            # Unlikely fallback: re-stat only if the field is missing
+            return self._format_datetime(os.path.getctime(path))
         except (OSError, AttributeError):
             return None
 
-    def _get_file_permissions(self, stats: os.stat_result) -> str:
-        """
-        Get file permissions in a readable format.
+    @staticmethod
+    def _ctime_none(stats: os.stat_result, path: str) -> Optional[str]:
+        """Linux and others: creation time isn't reliably available."""
+        return None
 
-        Args:
-            stats (os.stat_result): Result of os.stat() call
+    # Permission helpers, bound the same way in __init__.
 
-        Returns:
-            str: String representation of file permissions
-        """
-        if self.system == 'windows':
-            # Simple readonly check for Windows
-            return 'read-only' if stats.st_mode & stat.S_IWRITE == 0 else 'read-write'
-        else:
-            # Unix-style permission string
-            mode = stats.st_mode
-            perms = []
-            for who in ['USR', 'GRP', 'OTH']:
-                for what in ['R', 'W', 'X']:
-                    perm = getattr(stat, f'S_I{what}{who}')
-                    perms.append(what.lower() if mode & perm else '-')
-            return ''.join(perms)
-
-    def _get_file_info(self, entry: os.DirEntry) -> FileInfo:
+    @staticmethod
+    def _perms_windows(stats: os.stat_result) -> str:
+        """Simple readonly check for Windows."""
+        return 'read-only' if stats.st_mode & stat.S_IWRITE == 0 else 'read-write'
+
+    @staticmethod
+    def _perms_unix(stats: os.stat_result) -> str:
+        """Unix-style permission string via the precomputed bit table."""
+        mode = stats.st_mode
+        return ''.join(c if mode & b else '-' for c, b in zip(_PERM_CHARS, _PERM_BITS))
+
+    def _get_file_info(self, entry: os.DirEntry, stats: os.stat_result) -> FileInfo:
         """
         Gather metadata for a single file in a cross-platform manner.
 
         Args:
             entry (os.DirEntry): DirEntry object for the file
+            stats (os.stat_result): Stat result already fetched for the entry,
+                so every helper works from the same single syscall
 
         Returns:
             FileInfo: Dictionary containing file metadata
         """
-        stats = entry.stat()
-        
         # Get creation time if available
-        created_time = self._get_file_creation_time(entry.path)
+        created_time = self._get_file_creation_time(stats, entry.path)
         
         # Get modification time (available on all platforms)
         modified_time = self._format_datetime(stats.st_mtime)
@@ -167,80 +233,90 @@ class ProjectStructureTool:
             permissions=permissions
         )
 
-    def _build_recursive(self, current_path: str,
+    def _build_structure(self, root_path: str,
                          progress_callback: Optional[Callable[[str, int, int, str], None]] = None,
                          cancel_event: Optional[Any] = None,
                          counters: Optional[Dict[str, int]] = None) -> DirectoryStructure:
         """
-        Recursively build the structure for the current directory.
+        Build the structure for ``root_path`` with an explicit work stack.
+
+        The previous recursive formulation pushed a Python frame per
+        directory and could hit the recursion limit on pathological nesting
+        (deep node_modules trees); the stack carries (structure, path) pairs
+        instead, so depth costs a list slot rather than a frame.
 
         Args:
-            current_path (str): Path to the current directory to process
+            root_path (str): Path to the directory to process
 
         Returns:
             DirectoryStructure: Dictionary containing files and subfolders
         """
-        structure: DirectoryStructure = {
+        root_struct: DirectoryStructure = {
             "files": [],
             "subfolders": {}
         }
+        stack: List[tuple] = [(root_struct, root_path)]
 
-        try:
+        while stack:
             # Cooperative cancellation
             if cancel_event is not None and getattr(cancel_event, 'is_set', lambda: False)():
-                return structure
-
-            # Initial state notice is noisy; prefer per-entry increments below.
-
-            with os.scandir(current_path) as entries:
-                # Convert to list to avoid iterator invalidation issues on Windows
-                entries_list = sorted(list(entries), key=lambda e: e.name.casefold())
-                for entry in entries_list:
-                    # Check cancellation before processing each entry
-                    if cancel_event is not None and getattr(cancel_event, 'is_set', lambda: False)():
-                        return structure
-
-                    try:
-                        # Update progress for each encountered entry (file or directory)
-                        if counters is not None:
-                            counters['processed'] = counters.get('processed', 0) + 1
-                            if progress_callback is not None:
-                                progress_callback('project_structure', counters.get('processed', 0), counters.get('total', 0), entry.path)
-
-                        if entry.is_dir(follow_symlinks=False):
-                            # Skip excluded directories by name
-                            if entry.name in self.exclude_dirs:
-                                continue
-                            # Skip symlinks to avoid cycles
-                            structure["subfolders"][entry.name] = self._build_recursive(
-                                entry.path,
-                                progress_callback=progress_callback,
-                                cancel_event=cancel_event,
-                                counters=counters
-                            )
-                        else:
-                            # Process regular files only
-                            if entry.is_file(follow_symlinks=False):
-                                structure["files"].append(self._get_file_info(entry))
-                    except PermissionError:
-                        self._log(f"Permission denied accessing {entry.path}", level="WARNING")
-                    except OSError as e:
-                        self._log(f"Error accessing {entry.path}: {str(e)}", level="ERROR")
-                        
-        except PermissionError:
-            self._log(f"Permission denied accessing directory {current_path}", level="WARNING")
-        except OSError as e:
-            # Detect long-path issues for clearer logging
-            msg = str(e)
-            try:
-                import errno
-                if getattr(e, 'errno', None) == errno.ENAMETOOLONG or getattr(e, 'winerror', None) in (206,):
-                    msg = "Path too long"
-            except Exception:
-                pass
-            self._log(f"Error accessing directory {current_path}: {msg}", level="ERROR")
+                return root_struct
+            structure, current_path = stack.pop()
 
-        return structure
+            try:
+                with os.scandir(current_path) as entries:
+                    # Convert to list to avoid iterator invalidation issues on Windows
+                    entries_list = sorted(list(entries), key=lambda e: e.name.casefold())
+            except PermissionError:
+                self._log(f"Permission denied accessing directory {current_path}", level="WARNING")
+                continue
+            except OSError as e:
+                # Detect long-path issues for clearer logging
+                msg = str(e)
+                try:
+                    import errno
+                    if getattr(e, 'errno', None) == errno.ENAMETOOLONG or getattr(e, 'winerror', None) in (206,):
+                        msg = "Path too long"
+                except Exception:
+                    pass
+                self._log(f"Error accessing directory {current_path}: {msg}", level="ERROR")
+                continue
+
+            for entry in entries_list:
+                # Check cancellation before processing each entry
+                if cancel_event is not None and getattr(cancel_event, 'is_set', lambda: False)():
+                    return root_struct
+
+                try:
+                    # Update progress for each encountered entry (file or directory)
+                    if counters is not None:
+                        counters['processed'] = counters.get('processed', 0) + 1
+                        if progress_callback is not None:
+                            progress_callback('project_structure', counters.get('processed', 0), counters.get('total', 0), entry.path)
+
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip excluded directories by name
+                        if entry.name in self.exclude_dirs:
+                            continue
+                        # Skip symlinks to avoid cycles. Child dicts are
+                        # attached here, in sorted order, so the resulting
+                        # structure is identical to the recursive build.
+                        child: DirectoryStructure = {"files": [], "subfolders": {}}
+                        structure["subfolders"][entry.name] = child
+                        stack.append((child, entry.path))
+                    else:
+                        # Process regular files only. Stat once (no follow,
+                        # matching the is_file check above) and reuse the
+                        # result for every metadata helper.
+                        stats = entry.stat(follow_symlinks=False)
+                        if stat.S_ISREG(stats.st_mode):
+                            structure["files"].append(self._get_file_info(entry, stats))
+                except PermissionError:
+                    self._log(f"Permission denied accessing {entry.path}", level="WARNING")
+                except OSError as e:
+                    self._log(f"Error accessing {entry.path}: {str(e)}", level="ERROR")
+
+        return root_struct
 
     def build_project_structure(self,
                                 progress_callback: Optional[Callable[[str, int, int, str], None]] = None,
@@ -261,7 +337,7 @@ class ProjectStructureTool:
                 counters = {"processed": 0, "total": total}
 
         self.project_map = {
-            root_basename: self._build_recursive(self.project_root,
+            root_basename: self._build_structure(self.project_root,
                                                  progress_callback=progress_callback,
                                                  cancel_event=cancel_event,
                                                  counters=counters)
@@ -282,9 +358,15 @@ class ProjectStructureTool:
             # Normalize path and ensure directory exists
             output_file = os.path.normpath(output_file)
             os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
-            
-            with open(output_file, 'w', encoding='utf-8') as json_file:
-                json.dump(self.project_map, json_file, indent=4)
+
+            if orjson is not None:
+                # orjson serializes the whole map in C and returns bytes;
+                # several times faster than stdlib json on big trees.
+                with open(output_file, 'wb') as json_file:
+                    json_file.write(orjson.dumps(self.project_map, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8') as json_file:
+                    json.dump(self.project_map, json_file, indent=2)
             self._log(f"Project structure saved to {output_file}", level="INFO")
             
         except IOError as e:
@@ -321,6 +403,86 @@ class ProjectStructureTool:
                 f"Invalid JSON in structure file: {input_file}", e.doc, e.pos
             ) from e
 
+    def iter_files(self, input_file: str = 'project_structure.json') -> Iterator[Tuple[str, FileInfo]]:
+        """
+        Lazily yield ``(relative_path, FileInfo)`` for every file recorded in a
+        saved structure, in document order.
+
+        With ijson installed (the 'fast' extra) the JSON is consumed as an
+        event stream, so peak memory stays at one file record regardless of
+        structure size and searches can exit early. Otherwise the file is
+        loaded whole and walked iteratively — same results, higher peak
+        memory.
+
+        Args:
+            input_file (str): Path to a JSON file written by
+                ``save_project_structure``
+
+        Yields:
+            Tuple[str, FileInfo]: Path of the file relative to (and including)
+            the saved root name, and its metadata record.
+        """
+        input_file = os.path.normpath(input_file)
+        if ijson is not None:
+            yield from self._iter_files_streaming(input_file)
+            return
+
+        with open(input_file, 'r', encoding='utf-8') as json_file:
+            project_map = json.load(json_file)
+        stack: List[Tuple[str, DirectoryStructure]] = [
+            (name, node) for name, node in reversed(list(project_map.items()))
+        ]
+        while stack:
+            prefix, node = stack.pop()
+            for info in node.get('files', []):
+                yield (os.path.join(prefix, info['name']), info)
+            for name, child in reversed(list(node.get('subfolders', {}).items())):
+                stack.append((os.path.join(prefix, name), child))
+
+    @staticmethod
+    def _iter_files_streaming(input_file: str) -> Iterator[Tuple[str, FileInfo]]:
+        """
+        Event-driven walk of a saved structure via ijson.
+
+        Tracks the directory path with an explicit stack keyed off the
+        start_map/end_map events rather than ijson's dotted prefixes, which
+        would be ambiguous for names containing dots.
+        """
+        # Containers the cursor can be inside, pushed on start_map/start_array.
+        ROOT, DIR, SUBFOLDERS, FILES, FILEINFO = range(5)
+        contexts: List[int] = []
+        dir_names: List[str] = []
+        pending_key: Optional[str] = None
+        current: Dict[str, Any] = {}
+
+        with open(input_file, 'rb') as fh:
+            for _prefix, event, value in ijson.parse(fh):
+                if event == 'map_key':
+                    pending_key = value
+                elif event == 'start_map':
+                    if not contexts:
+                        contexts.append(ROOT)
+                    elif contexts[-1] in (ROOT, SUBFOLDERS):
+                        contexts.append(DIR)
+                        dir_names.append(pending_key)
+                    elif contexts[-1] == DIR and pending_key == 'subfolders':
+                        contexts.append(SUBFOLDERS)
+                    elif contexts[-1] == FILES:
+                        contexts.append(FILEINFO)
+                        current = {}
+                elif event == 'start_array':
+                    contexts.append(FILES)
+                elif event == 'end_array':
+                    contexts.pop()
+                elif event == 'end_map':
+                    ctx = contexts.pop()
+                    if ctx == DIR:
+                        dir_names.pop()
+                    elif ctx == FILEINFO:
+                        yield (os.path.join(*dir_names, current['name']), current)
+                elif contexts and contexts[-1] == FILEINFO:
+                    current[pending_key] = value
+
 
 if __name__ == "__main__":
     try:
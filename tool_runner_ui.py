@@ -22,28 +22,130 @@ A comprehensive Tkinter-based GUI for:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
+import hashlib
+import io
 import os
+import shutil
 import threading
 import queue
+import re
 import sys
 import json
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from file_loader_tool import FileLoaderTool, DEFAULT_EXCLUDE_DIRS
 from project_structure_tool import ProjectStructureTool
 
+# Optional fast JSON parser (via the 'fast' extra), same convention as
+# project_structure_tool. Structure files for big repos run to tens of
+# megabytes and the parse sits on the UI's refresh path.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Simple settings file used to persist UI options
 SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tool_runner_settings.json")
 
+# Filetype filter shared by the snapshot save/load dialogs.
+_JSON_FILETYPES = [("JSON files", "*.json"), ("All files", "*.*")]
+
+# Leading tree-drawing prefix on a row's display text; fallback used only
+# for rows missing from the _raw_name map.
+_ASCII_PREFIX_RE = re.compile(r"^[├└│─ ]+")
+
+# ASCII fragments for the tree rendering, built once instead of per node.
+_INDENT_BLANK = "    "
+_INDENT_PIPE = "│   "
+_CONN_LAST = "└── "
+_CONN_MID = "├── "
+
+
+@lru_cache(maxsize=4096)
+def _folder_prefix(ancestors: Tuple[bool, ...]) -> str:
+    """ASCII prefix for a folder row; ancestors[i] is True if that ancestor
+    was the last child at its level.
+
+    Cached on the ancestors tuple: every sibling at the same depth shares
+    one prefix, so a wide tree assembles each distinct prefix once instead
+    of walking the ancestor list per row."""
+    if not ancestors:
+        return ""
+    parts = [_INDENT_BLANK if a else _INDENT_PIPE for a in ancestors[:-1]]
+    parts.append(_CONN_LAST if ancestors[-1] else _CONN_MID)
+    return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _file_prefix(ancestors: Tuple[bool, ...], is_last_child: bool) -> str:
+    """ASCII prefix for a file row under a folder with the given ancestors.
+
+    Cached like ``_folder_prefix``; see there."""
+    parts = [_INDENT_BLANK if a else _INDENT_PIPE for a in ancestors[:-1]]
+    if ancestors:
+        parts.append(_CONN_LAST if (ancestors[-1] and is_last_child) else _CONN_MID)
+    else:
+        parts.append(_CONN_LAST if is_last_child else _CONN_MID)
+    return "".join(parts)
+
+
+def _tree_fingerprint(root: str, excludes: "set[str]") -> str:
+    """
+    Fingerprint a directory tree as a 128-bit blake2b hex digest over the
+    (path, st_mtime_ns) pair of every entry, plus the active excludes.
+
+    One scandir pass over the tree is far cheaper than rebuilding the
+    structure (no per-file timestamp formatting or permission reads), so
+    the digest works as a cache key for the built structure JSON: same
+    digest means the tree and settings that shaped the JSON are unchanged.
+    Excluded directories are skipped the same way the tools skip them.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(excludes):
+        h.update(name.encode("utf-8", "replace") + b"\0")
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            h.update(f"{entry.path}\0{st.st_mtime_ns}\n".encode("utf-8", "replace"))
+            try:
+                if entry.is_dir(follow_symlinks=False) and entry.name not in excludes:
+                    stack.append(entry.path)
+            except OSError:
+                continue
+    return h.hexdigest()
+
 
 ################################################
 # Tooltip System
 ################################################
 class ToolTip:
     """
-    A small tooltip class for Tkinter widgets, creating a little popup window
+    A small tooltip class for Tkinter widgets, showing a little popup window
     near the widget on hover.
+
+    All tooltips share one hidden ``Toplevel``/``Label`` pair, created
+    lazily on the first hover: showing a tip just repositions, retexts, and
+    deiconifies the shared window instead of constructing and destroying a
+    popup (and its X round-trips) on every hover.
     """
+
+    _shared_tw: Optional[tk.Toplevel] = None
+    _shared_label: Optional[tk.Label] = None
+    _owner: Optional["ToolTip"] = None
+
     def __init__(self, widget: tk.Widget, text: str = "") -> None:
         """
         Initialize the tooltip.
@@ -54,38 +156,48 @@ class ToolTip:
         """
         self.widget = widget
         self.text = text
-        self.tip_window: Optional[tk.Toplevel] = None
         self.widget.bind("<Enter>", self._show_tip)
         self.widget.bind("<Leave>", self._hide_tip)
 
+    @classmethod
+    def _ensure_shared(cls, parent: tk.Widget) -> tk.Toplevel:
+        """Create the shared popup window once, hidden until first use."""
+        if cls._shared_tw is None or not cls._shared_tw.winfo_exists():
+            tw = tk.Toplevel(parent)
+            tw.wm_overrideredirect(True)
+            tw.attributes("-topmost", True)
+            tw.withdraw()
+            label = tk.Label(
+                tw,
+                justify=tk.LEFT,
+                background="#ffffe0",
+                relief=tk.SOLID,
+                borderwidth=1,
+                font=("tahoma", 8, "normal")
+            )
+            label.pack(ipadx=4, ipady=2)
+            cls._shared_tw = tw
+            cls._shared_label = label
+        return cls._shared_tw
+
     def _show_tip(self, event: Optional[tk.Event] = None) -> None:
         """Show the tooltip if not already visible."""
-        if self.tip_window or not self.text:
+        if ToolTip._owner is self or not self.text:
             return
-        self.tip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.attributes("-topmost", True)
+        tw = self._ensure_shared(self.widget)
 
         x_left = self.widget.winfo_rootx() + 20
         y_top = self.widget.winfo_rooty() + self.widget.winfo_height() + 10
+        ToolTip._shared_label.configure(text=self.text)
         tw.wm_geometry(f"+{x_left}+{y_top}")
-
-        label = tk.Label(
-            tw,
-            text=self.text,
-            justify=tk.LEFT,
-            background="#ffffe0",
-            relief=tk.SOLID,
-            borderwidth=1,
-            font=("tahoma", 8, "normal")
-        )
-        label.pack(ipadx=4, ipady=2)
+        tw.deiconify()
+        ToolTip._owner = self
 
     def _hide_tip(self, event: Optional[tk.Event] = None) -> None:
         """Hide the tooltip window."""
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+        if ToolTip._owner is self and ToolTip._shared_tw is not None:
+            ToolTip._shared_tw.withdraw()
+            ToolTip._owner = None
 
 
 def create_tooltip(widget: tk.Widget, text: str) -> 'ToolTip':
@@ -108,7 +220,18 @@ def create_tooltip(widget: tk.Widget, text: str) -> 'ToolTip':
 class TextRedirector:
     """
     A class to redirect stdout (print statements) into a Tkinter ScrolledText widget.
+
+    ``write`` is completely passive: it only appends to a
+    ``queue.SimpleQueue``, so any thread may print without making a single
+    Tcl call. The UI drains the queue with a periodic ``drain`` loop on
+    the Tk main thread (see ``ToolRunnerUI._drain_console``), inserting
+    a whole burst of output with one Tk insert.
     """
+
+    # Drain interval. Long enough to coalesce a burst of prints, short
+    # enough to read as live output.
+    FLUSH_MS = 30
+
     def __init__(self, widget: scrolledtext.ScrolledText, tag: str = "stdout") -> None:
         """
         Initialize the redirector.
@@ -119,13 +242,29 @@ class TextRedirector:
         """
         self.widget = widget
         self.tag = tag
+        self._pending: "queue.SimpleQueue[str]" = queue.SimpleQueue()
 
     def write(self, string: str) -> None:
         """
-        Write the given string into the scrolled text widget.
+        Queue the given string for the scrolled text widget.
+
+        Safe from any thread: the text is only buffered here and inserted
+        by ``drain`` on the thread running the mainloop.
         """
+        self._pending.put(string)
+
+    def drain(self) -> None:
+        """Pour all buffered text into the widget; must run on the Tk main thread."""
+        parts: List[str] = []
+        try:
+            while True:
+                parts.append(self._pending.get_nowait())
+        except queue.Empty:
+            pass
+        if not parts:
+            return
         self.widget.configure(state="normal")
-        self.widget.insert("end", string, (self.tag,))
+        self.widget.insert("end", "".join(parts), (self.tag,))
         self.widget.configure(state="disabled")
         self.widget.see("end")
 
@@ -151,6 +290,10 @@ class WrapFrame(tk.Frame):
         super().__init__(parent, **kwargs)
         self.margin = margin
         self._items: List[tk.Widget] = []
+        # Cached (reqwidth, reqheight) per child; None means "ask Tk on the
+        # next reflow". <Configure> fires continuously while the user drags
+        # the window edge, and two Tcl round-trips per child per event add up.
+        self._sizes: List[Optional[Tuple[int, int]]] = []
         self.bind("<Configure>", self._on_configure)
 
     def add_widget(self, widget: tk.Widget) -> None:
@@ -158,17 +301,28 @@ class WrapFrame(tk.Frame):
         Add a child widget to this wrap frame. We'll place it ourselves in flow layout.
         """
         self._items.append(widget)
+        self._sizes.append(None)
         widget.place(x=0, y=0)
 
+    def invalidate(self) -> None:
+        """
+        Drop the cached child sizes. Call after changing a child's text or
+        font so the next reflow re-measures it.
+        """
+        self._sizes = [None] * len(self._items)
+
     def _on_configure(self, event: tk.Event) -> None:
         """
         Reflow child widgets whenever the frame is resized.
         """
         x, y = self.margin, self.margin
         line_height = 0
-        for child in self._items:
-            reqw = child.winfo_reqwidth()
-            reqh = child.winfo_reqheight()
+        for i, child in enumerate(self._items):
+            size = self._sizes[i]
+            if size is None:
+                size = (child.winfo_reqwidth(), child.winfo_reqheight())
+                self._sizes[i] = size
+            reqw, reqh = size
             if x + reqw + self.margin > event.width:
                 x = self.margin
                 y += line_height + self.margin
@@ -234,16 +388,51 @@ class ToolRunnerUI(tk.Tk):
         # Map tree item IDs to their absolute file paths for context menu
         self._tree_item_paths: Dict[str, str] = {}
 
-        # Configure TTK styles for various colored buttons
-        style = ttk.Style(self)
-        # self._apply_consistent_theme(style)
-        style.configure("Run.TButton",        background="lightgreen",  foreground="black")
-        style.configure("Clear.TButton",      background="lightcoral",  foreground="black")
-        style.configure("HideTree.TButton",   background="white",       foreground="black")
-        style.configure("HideConsole.TButton",background="black",       foreground="green")
-        style.configure("About.TButton",      background="white",       foreground="blue")
-        style.configure("TreeTool.TButton",   background="lightblue",   foreground="black")
-        style.configure("Status.TButton",   background="grey",   foreground="green")
+        # Parsed structure JSON memo, keyed by path with an (mtime_ns, size)
+        # signature: toggles and filters rebuild the tree repeatedly from the
+        # same file, and re-parsing a large structure on every toggle costs
+        # far more than the rebuild itself.
+        self._json_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+        # Per-subtree file counts, keyed by id() of the folder dicts held in
+        # _json_cache. Cleared whenever a structure file is (re)parsed so the
+        # ids can never outlive the dicts they describe.
+        self._count_memo: Dict[int, int] = {}
+
+        # Debounce state for the tree search box: pending after() id and the
+        # last query that was actually applied to the tree.
+        self._search_after_id: Optional[str] = None
+        self._last_search_query: Optional[str] = None
+
+        # Small pool for snapshot reads/writes so multi-MB JSON (de)serialization
+        # does not stall the event loop; results are marshaled back via after().
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+
+        # File-node iid -> extension (".py", or "" for no extension), filled
+        # while the tree is built. Lets filtering test membership in Python
+        # instead of fetching text and tags from Tcl per node.
+        self._item_ext: Dict[str, str] = {}
+
+        # Folder iid -> (node dict, ancestors, path) for folders whose
+        # children have not been inserted yet; see _populate_folder.
+        self._pending_subtrees: Dict[str, Tuple[Dict[str, Any], Tuple[bool, ...], str]] = {}
+
+        # iid -> lowercased row text for every node, and the set of iids
+        # currently carrying the 'highlight' tag. Search matches against the
+        # Python map and re-tags only the rows whose match state changed.
+        self._item_text: Dict[str, str] = {}
+        self._highlighted: set = set()
+
+        # iid -> bare name (no ASCII prefix), recorded at insert time so
+        # snapshot saving never has to strip tree-drawing symbols back out
+        # of the row text.
+        self._raw_name: Dict[str, str] = {}
+
+
+        # The per-button color styles are cosmetic and not needed to lay the
+        # window out, so they are applied from _finish_init once the first
+        # paint is done; this shaves widget-construction work off cold start.
+        self.after_idle(self._finish_init)
         # Main frame
         self.main_frame = ttk.Frame(self)
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -519,7 +708,7 @@ class ToolRunnerUI(tk.Tk):
         self.tree_toolbar.add_widget(lbl_search)
 
         self.search_entry = ttk.Entry(self.tree_toolbar, width=15)
-        self.search_entry.bind('<KeyRelease>', self.search_tree)
+        self.search_entry.bind('<KeyRelease>', self._schedule_search)
         self.tree_toolbar.add_widget(self.search_entry)
 
         lbl_filetypes = ttk.Label(self.tree_toolbar, text="File Types:")
@@ -594,7 +783,7 @@ class ToolRunnerUI(tk.Tk):
             padding=5
         )
 
-        style.configure(
+        ttk.Style(self).configure(
             "Treeview",
             background="white",
             fieldbackground="white",
@@ -628,9 +817,11 @@ class ToolRunnerUI(tk.Tk):
         self.tree_frame.columnconfigure(0, weight=1)
         self.tree_frame.rowconfigure(0, weight=1)
 
-        # Context menu for tree items
-        self._create_context_menu()
+        # Context menu for tree items (created lazily on first right-click)
+        self.tree_context_menu: Optional[tk.Menu] = None
         self.tree.bind("<Button-3>", self._on_tree_right_click)
+        # Lazy population: folders carry a stub child until first opened.
+        self.tree.bind("<<TreeviewOpen>>", self._expand_lazy)
 
         # Initially show all columns
         self.update_displaycolumns()
@@ -651,14 +842,35 @@ class ToolRunnerUI(tk.Tk):
         self.console.tag_configure("WARNING", foreground="yellow")
         self.console.tag_configure("ERROR", foreground="red")
 
-        # Redirect stdout to the console
+        # Redirect stdout to the console. The redirector only queues text;
+        # a permanent after() loop on this (the Tk) thread drains it, so
+        # worker threads can print without ever touching Tcl.
         self.original_stdout = sys.stdout
-        sys.stdout = TextRedirector(self.console, "stdout")
+        self._stdout_redirector = TextRedirector(self.console, "stdout")
+        sys.stdout = self._stdout_redirector
+        self.after(TextRedirector.FLUSH_MS, self._drain_console)
         self.log_entries: List[str] = []
 
         # Load persisted UI settings (if any) now that widgets exist
         self._load_settings()
 
+    def _finish_init(self) -> None:
+        """
+        Apply non-critical setup deferred from ``__init__`` via ``after_idle``.
+
+        Runs once the event loop is idle, i.e. after the window has been laid
+        out and painted. Currently this is just the colored button styles;
+        deferring them keeps cold start focused on getting widgets on screen.
+        """
+        style = ttk.Style(self)
+        style.configure("Run.TButton",        background="lightgreen",  foreground="black")
+        style.configure("Clear.TButton",      background="lightcoral",  foreground="black")
+        style.configure("HideTree.TButton",   background="white",       foreground="black")
+        style.configure("HideConsole.TButton",background="black",       foreground="green")
+        style.configure("About.TButton",      background="white",       foreground="blue")
+        style.configure("TreeTool.TButton",   background="lightblue",   foreground="black")
+        style.configure("Status.TButton",   background="grey",   foreground="green")
+
     def __del__(self) -> None:
         """
         Restore original stdout upon destruction.
@@ -918,16 +1130,20 @@ class ToolRunnerUI(tk.Tk):
         """
         # Step 1: close everything
         self.toggle_tree_view(False)
-        # Step 2: reopen each child if it's a folder
+        # Step 2: reopen each child if it's a folder. File rows are known
+        # from the Python-side _item_ext map, so no per-child Tcl tag fetch
+        # (which would also misread folders currently tagged 'highlight').
         for child in self.tree.get_children(''):
-            # If it's a folder, re-open it to see if it has sub-nodes
-            # but keep sub-nodes collapsed
-            if 'folder' in self.tree.item(child, 'tags'):
-                self.tree.item(child, open=True)
-            else:
-                # If it's a file, detach or remain collapsed
-                # Let's detach so that top-level file is not visible
+            if child in self._item_ext:
+                # Top-level file: detach so it is not visible when partially
+                # collapsed.
                 self.tree.detach(child)
+            else:
+                # Folder: re-open it to show its (collapsed) sub-nodes.
+                # Opening programmatically skips <<TreeviewOpen>>, so make
+                # sure the children actually exist first.
+                self._populate_folder(child)
+                self.tree.item(child, open=True)
 
     ################################################
     # Toggle Tree/Console Panes
@@ -1095,6 +1311,7 @@ class ToolRunnerUI(tk.Tk):
             target=self._worker_run,
             args=(project_root, sel_file_loader, file_loader_output, log_output,
                   sel_project_structure, structure_output, excludes),
+            daemon=True,
         )
         self.worker_thread.start()
         # Start polling UI queue
@@ -1155,6 +1372,15 @@ class ToolRunnerUI(tk.Tk):
             self.progress.config(mode='determinate')
             self._indeterminate = False
 
+    def _drain_console(self) -> None:
+        """
+        Permanent main-thread loop pouring queued stdout text into the
+        console. Runs for the lifetime of the window; writers never touch
+        Tk themselves.
+        """
+        self._stdout_redirector.drain()
+        self.after(TextRedirector.FLUSH_MS, self._drain_console)
+
     def _poll_status(self) -> None:
         # Drain queue and update UI
         try:
@@ -1245,6 +1471,10 @@ class ToolRunnerUI(tk.Tk):
             # Persist current UI settings before exit (best-effort)
             self._save_settings()
 
+            # Let queued snapshot reads/writes finish in the background;
+            # nothing new can be submitted once the window goes away.
+            self._io_executor.shutdown(wait=False)
+
             # If no worker or not running, safe to close immediately
             if not self.running or self.worker_thread is None or not self.worker_thread.is_alive():
                 self.destroy()
@@ -1296,16 +1526,41 @@ class ToolRunnerUI(tk.Tk):
 
             # 2) Project Structure
             if sel_project_structure:
-                structure_tool = ProjectStructureTool(project_root, logger=self._enqueue_log, exclude_dirs=excludes)
-                structure_tool.build_project_structure(
-                    progress_callback=self._progress_callback,
-                    cancel_event=self.cancel_event,
-                )
+                # Re-running on an unchanged tree is common, and building the
+                # structure is the slow step. Fingerprint the tree first and
+                # reuse the previously built JSON when nothing moved.
+                cache_dir = os.path.join(os.path.dirname(structure_output) or ".", ".cache")
+                cache_path: Optional[str] = None
+                cache_hit = False
+                try:
+                    fingerprint = _tree_fingerprint(project_root, excludes)
+                    cache_path = os.path.join(cache_dir, f"structure-{fingerprint}.json")
+                    if os.path.isfile(cache_path):
+                        shutil.copyfile(cache_path, structure_output)
+                        cache_hit = True
+                except OSError:
+                    cache_path = None
                 if self.cancel_event is not None and self.cancel_event.is_set():
                     self.status_q.put({"type": "cancelled"})
                     return
-                structure_tool.save_project_structure(structure_output)
-                self._enqueue_log(f"Project structure saved to {structure_output}")
+
+                if cache_hit:
+                    self._enqueue_log(
+                        f"Project tree unchanged; reused cached structure for {structure_output}"
+                    )
+                else:
+                    structure_tool = ProjectStructureTool(project_root, logger=self._enqueue_log, exclude_dirs=excludes)
+                    structure_tool.build_project_structure(
+                        progress_callback=self._progress_callback,
+                        cancel_event=self.cancel_event,
+                    )
+                    if self.cancel_event is not None and self.cancel_event.is_set():
+                        self.status_q.put({"type": "cancelled"})
+                        return
+                    structure_tool.save_project_structure(structure_output)
+                    self._enqueue_log(f"Project structure saved to {structure_output}")
+                    if cache_path is not None:
+                        self._store_structure_cache(cache_dir, cache_path, structure_output)
                 # Request UI to load structure
                 self.status_q.put({"type": "ui", "action": "load_structure", "path": structure_output})
 
@@ -1313,6 +1568,25 @@ class ToolRunnerUI(tk.Tk):
         except Exception as e:
             self.status_q.put({"type": "error", "message": str(e)})
 
+    @staticmethod
+    def _store_structure_cache(cache_dir: str, cache_path: str, structure_output: str) -> None:
+        """
+        Copy the freshly built structure JSON into the output cache,
+        dropping any stale fingerprints so the cache holds one entry.
+        The cache is best-effort: failures only cost the next reuse.
+        """
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for old_name in os.listdir(cache_dir):
+                if old_name.startswith("structure-") and old_name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(cache_dir, old_name))
+                    except OSError:
+                        pass
+            shutil.copyfile(structure_output, cache_path)
+        except OSError:
+            pass
+
     def clear_console(self) -> None:
         """
         Clear the console text area.
@@ -1355,7 +1629,11 @@ class ToolRunnerUI(tk.Tk):
         # Select the item
         self.tree.selection_set(item_id)
         self.tree.focus(item_id)
-        
+
+        # Build the menu on first use; most sessions never right-click.
+        if self.tree_context_menu is None:
+            self._create_context_menu()
+
         # Show context menu at cursor position
         try:
             self.tree_context_menu.tk_popup(event.x_root, event.y_root)
@@ -1467,6 +1745,29 @@ class ToolRunnerUI(tk.Tk):
     ################################################
     # Build & Display ASCII Tree (with real root name + folder file counts)
     ################################################
+    def _load_structure_cached(self, json_file: str) -> Dict[str, Any]:
+        """
+        Return the parsed structure for ``json_file``, re-reading it only
+        when the file on disk has changed (checked via mtime_ns + size).
+        """
+        st = os.stat(json_file)
+        sig = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(json_file)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+        # Read the whole file and parse the buffer: loads() skips the stream
+        # reader json.load() layers on top, and orjson parses in C when the
+        # 'fast' extra is installed.
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+        structure: Dict[str, Any] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        self._json_cache[json_file] = (sig, structure)
+        # The memo is keyed by id() of folder dicts; dropping a structure may
+        # free those dicts, so start the counts over rather than risk an id
+        # being reused by a fresh node.
+        self._count_memo.clear()
+        return structure
+
     def load_and_display_structure(self, json_file: str) -> None:
         """
         Read the JSON file to get the project structure dict,
@@ -1477,13 +1778,24 @@ class ToolRunnerUI(tk.Tk):
         expand_states = self._remember_open_states()
 
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                structure: Dict[str, Any] = json.load(f)
+            structure: Dict[str, Any] = self._load_structure_cached(json_file)
+
+            # Hide the data columns while rows pour in, so each insert
+            # repaints a single narrow column; restored in one shot below.
+            self.tree["displaycolumns"] = ()
 
             # Clear old tree first
             self.tree.delete(*self.tree.get_children())
             # Clear path mapping
             self._tree_item_paths.clear()
+            self._item_ext.clear()
+            self._item_text.clear()
+            self._raw_name.clear()
+            self._highlighted.clear()
+            self._pending_subtrees.clear()
+            # Fresh rows carry no highlight, so the next search must run even
+            # if the query text is unchanged.
+            self._last_search_query = None
 
             # Get project root for building absolute paths
             project_root = self.dir_entry.get().strip()
@@ -1491,16 +1803,16 @@ class ToolRunnerUI(tk.Tk):
                 self._append_log_line("WARNING", "Project root not set; paths will not be available for context menu.")
                 project_root = ""
 
-            # If there's exactly one top-level key, treat that as the root folder
-            top_keys = sorted(structure.keys())
-            if len(top_keys) == 1:
-                root_name = top_keys[0]
+            # If there's exactly one top-level key, treat that as the root
+            # folder; the common single-root case skips the key sort.
+            if len(structure) == 1:
+                root_name = next(iter(structure))
                 root_data = structure[root_name]
                 # Use project_root directly since it already points to the root folder
                 self._build_tree_ascii("", root_data, [], root_name, project_root)
             else:
                 # multiple top-level folders
-                for key in top_keys:
+                for key in sorted(structure):
                     key_path = os.path.join(project_root, key) if project_root else key
                     self._build_tree_ascii("", structure[key], [], key, key_path)
 
@@ -1509,10 +1821,26 @@ class ToolRunnerUI(tk.Tk):
         except Exception as e:
             self._append_log_line("ERROR", f"Error loading structure: {str(e)}")
             return
+        finally:
+            self.update_displaycolumns()
+            # Invariant: no update()/update_idletasks() anywhere inside the
+            # rebuild itself (each call re-enters the event loop and repaints).
+            # One flush here, after the columns are back, shows the finished
+            # tree in a single redraw.
+            self.update_idletasks()
 
         # Step 2: restore expansions
         self._restore_open_states(expand_states)
 
+    def _free_iid(self, parent_iid: str, name: str) -> Optional[str]:
+        """
+        Deterministic iid for a new row: the parent's iid plus the bare
+        folder/file name. Returns None (let Tk auto-assign) if that iid is
+        already taken, e.g. a folder and file sharing a name.
+        """
+        iid = f"{parent_iid}/{name}" if parent_iid else name
+        return None if self.tree.exists(iid) else iid
+
     def _build_tree_ascii(
         self,
         parent_node: str,
@@ -1522,10 +1850,16 @@ class ToolRunnerUI(tk.Tk):
         current_path: str = ""
     ) -> None:
         """
-        Insert exactly one node for 'folder_name', then recursively
-        insert subfolders/files, ensuring we do not duplicate subfolder names.
-        Also, for folders, we display "N files" in the 'Size' column,
-        where N is the total number of files in that folder's subtree.
+        Insert exactly one node for 'folder_name'; its subtree is inserted
+        lazily. For folders, the 'Size' column shows "N files" for the
+        folder's subtree.
+
+        Only the folder row itself goes into the Treeview here. A non-empty
+        folder gets a single stub child so Tk draws the expand triangle, and
+        its real children are inserted by ``_populate_folder`` the first
+        time it is opened (via <<TreeviewOpen>> or one of the programmatic
+        expansion paths). Loading a huge structure therefore costs a handful
+        of inserts instead of one per node.
 
         Args:
             parent_node: ID of the parent node in the TreeView,
@@ -1535,143 +1869,169 @@ class ToolRunnerUI(tk.Tk):
                        child at its level, for building ASCII prefix.
             folder_name: The name of this folder to display.
         """
-        # Build ASCII prefix for this folder's line
-        prefix_parts: List[str] = []
-        for ancestor_last in ancestors[:-1]:
-            prefix_parts.append("    " if ancestor_last else "│   ")
-        if ancestors:
-            prefix_parts.append("└── " if ancestors[-1] else "├── ")
-        ascii_prefix = "".join(prefix_parts)
+        self._insert_folder_row(parent_node, folder_name, data, tuple(ancestors), current_path)
 
-        # For folder: count total files in sub-tree
-        num_files = self._count_files_in_tree(data)
+    def _insert_folder_row(
+        self,
+        parent_iid: str,
+        name: str,
+        node: Dict[str, Any],
+        anc: Tuple[bool, ...],
+        path: str
+    ) -> str:
+        """
+        Insert one folder row with a deterministic name-path iid, deferring
+        its children: the subtree data is parked in ``_pending_subtrees``
+        and a stub child makes the row expandable.
+        """
+        num_files = self._count_files_in_tree(node)
+        folder_text = f"{_folder_prefix(anc)}{name}"
         folder_id = self.tree.insert(
-            parent_node,
+            parent_iid,
             "end",
-            text=f"{ascii_prefix}{folder_name}",
+            iid=self._free_iid(parent_iid, name),
+            text=folder_text,
             values=(f"{num_files} files", "", ""),  # place file count in 'size' column
             tags=('folder',),
             open=False
         )
-        
+        self._item_text[folder_id] = folder_text.lower()
+        self._raw_name[folder_id] = name
         # Store folder path for context menu
-        if current_path:
-            self._tree_item_paths[folder_id] = current_path
-
-        # Extract subfolders, files
-        subfolders: Dict[str, Any] = data.get("subfolders", {})
-        files: List[Union[str, Dict[str, Any]]] = data.get("files", [])
-
-        # Build a list of children for sorting
-        children: List[Tuple[Any, str, Optional[Dict[str, Any]]]] = []
-
-        # subfolders => (sf_name, "folder", subfolder_data)
-        for sf_name, sf_data in subfolders.items():
-            if self._should_show_dir(sf_name):
-                children.append((sf_name, "folder", sf_data))
-
-        # files => either "file" (just a string) or "fileobj" (a dict with name, size, etc.)
-        for f_item in files:
-            if isinstance(f_item, dict) and "name" in f_item:
-                children.append((f_item, "fileobj", None))
-            else:
-                children.append((f_item, "file", None))
+        if path:
+            self._tree_item_paths[folder_id] = path
+        if node.get("subfolders") or node.get("files"):
+            self.tree.insert(folder_id, "end", text="…", tags=('stub',))
+            self._pending_subtrees[folder_id] = (node, anc, path)
+        return folder_id
 
-        def get_sort_key(ch: Tuple[Any, str, Optional[Dict[str, Any]]]) -> str:
-            name, kind, _ = ch
-            if kind == "folder":
-                return str(name).lower()
-            elif kind == "fileobj":
-                return str(name["name"]).lower()
-            else:
-                return str(name).lower()
-
-        children.sort(key=get_sort_key)
-
-        # Insert each subfolder/file
+    def _populate_folder(self, folder_id: str) -> None:
+        """
+        Replace a folder row's stub with its real children. No-op if the
+        folder is already populated (or has no deferred subtree).
+        """
+        pending = self._pending_subtrees.pop(folder_id, None)
+        if pending is None:
+            return
+        node, anc, path = pending
+        # The only children at this point are stub rows.
+        self.tree.delete(*self.tree.get_children(folder_id))
+
+        # The Show Excluded Dirs filter is applied here rather than baked
+        # into the cached sort, so toggling it never invalidates the cache.
+        show_excluded = self.show_excluded.get()
+        children = [
+            ch for ch in self._node_sorted_children(node)
+            if ch[1] != "folder" or self._should_show_dir(str(ch[0]), show_excluded)
+        ]
+
+        last_index = len(children) - 1
         for i, (child, kind, subdata) in enumerate(children):
-            is_last_child = (i == len(children) - 1)
+            is_last_child = (i == last_index)
 
             if kind == "folder":
-                # Recursively call _build_tree_ascii for the subfolder
-                subfolder_path = os.path.join(current_path, str(child)) if current_path else ""
-                self._build_tree_ascii(
-                    parent_node=folder_id,
-                    data=subdata,
-                    ancestors=ancestors + [is_last_child],
-                    folder_name=str(child),
-                    current_path=subfolder_path
+                subfolder_path = os.path.join(path, str(child)) if path else ""
+                self._insert_folder_row(
+                    folder_id, str(child), subdata, anc + (is_last_child,), subfolder_path
                 )
+                continue
 
-            elif kind == "fileobj":
-                # It's a dict with { name, size, created, modified } etc.
+            if kind == "fileobj":
                 fname: str = str(child.get("name", "unknown"))
                 fsize = child.get("size", None)
-                fcreated = child.get("created", None)
-                fmod = child.get("modified", None)
-
-                child_prefix_parts: List[str] = []
-                for ancestor_last in ancestors[:-1]:
-                    child_prefix_parts.append("    " if ancestor_last else "│   ")
-                if ancestors:
-                    child_prefix_parts.append("└── " if ancestors[-1] and is_last_child else "├── ")
-                else:
-                    child_prefix_parts.append("└── " if is_last_child else "├── ")
-                ascii_child_prefix = "".join(child_prefix_parts)
-
-                file_text = f"{ascii_child_prefix}{fname}"
-                size_str = f"{fsize} bytes" if fsize else ""
-                created_str = fcreated or ""
-                mod_str = fmod or ""
-
-                file_id = self.tree.insert(
-                    folder_id,
-                    "end",
-                    text=file_text,
-                    values=(size_str, created_str, mod_str),
-                    tags=('file',)
+                file_values = (
+                    f"{fsize} bytes" if fsize else "",
+                    child.get("created", None) or "",
+                    child.get("modified", None) or ""
                 )
-                
-                # Store file path for context menu
-                if current_path:
-                    file_path = os.path.join(current_path, fname)
-                    self._tree_item_paths[file_id] = file_path
-
             else:
-                # Plain string for a file
-                child_prefix_parts: List[str] = []
-                for ancestor_last in ancestors[:-1]:
-                    child_prefix_parts.append("    " if ancestor_last else "│   ")
-                if ancestors:
-                    child_prefix_parts.append("└── " if ancestors[-1] and is_last_child else "├── ")
-                else:
-                    child_prefix_parts.append("└── " if is_last_child else "├── ")
-                ascii_child_prefix = "".join(child_prefix_parts)
-
-                fname_str = f"{ascii_child_prefix}{child}"
-                file_id = self.tree.insert(
-                    folder_id,
-                    "end",
-                    text=fname_str,
-                    values=("", "", ""),
-                    tags=('file',)
-                )
-                
-                # Store file path for context menu  
-                if current_path:
-                    file_path = os.path.join(current_path, str(child))
-                    self._tree_item_paths[file_id] = file_path
+                fname = str(child)
+                file_values = ("", "", "")
+            file_text = f"{_file_prefix(anc, is_last_child)}{fname}"
+            file_id = self.tree.insert(
+                folder_id,
+                "end",
+                iid=self._free_iid(folder_id, fname),
+                text=file_text,
+                values=file_values,
+                tags=('file',)
+            )
+            dot = fname.rfind('.')
+            self._item_ext[file_id] = fname[dot:] if dot != -1 else ""
+            self._item_text[file_id] = file_text.lower()
+            self._raw_name[file_id] = fname
+            file_path = os.path.join(path, fname) if path else ""
+            if file_path:
+                self._tree_item_paths[file_id] = file_path
+
+    @staticmethod
+    def _node_sorted_children(node: Dict[str, Any]) -> List[Tuple[Any, str, Optional[Dict[str, Any]]]]:
+        """
+        Return this folder's children as (child, kind, subdata) tuples
+        sorted by name, where kind is "folder", "fileobj", or "file".
+
+        The sorted list is memoized on the node dict (under a key no
+        structure JSON uses), so toggles and re-displays of the same
+        cached structure pay the per-folder sort once instead of on
+        every rebuild.
+        """
+        cached = node.get("_sorted_children")
+        if cached is not None:
+            return cached
+
+        # Decorate-sort-undecorate: the lowered name is computed once per
+        # child here, so the sort compares plain strings instead of calling
+        # a key closure N log N times.
+        keyed: List[Tuple[str, Tuple[Any, str, Optional[Dict[str, Any]]]]] = []
+        for sf_name, sf_data in (node.get("subfolders") or {}).items():
+            keyed.append((str(sf_name).lower(), (sf_name, "folder", sf_data)))
+        for f_item in (node.get("files") or ()):
+            if isinstance(f_item, dict) and "name" in f_item:
+                keyed.append((str(f_item["name"]).lower(), (f_item, "fileobj", None)))
+            else:
+                keyed.append((str(f_item).lower(), (f_item, "file", None)))
+
+        keyed.sort(key=itemgetter(0))
+        children = [entry for _, entry in keyed]
+        node["_sorted_children"] = children
+        return children
+
+    def _expand_lazy(self, event: Optional[tk.Event] = None) -> None:
+        """<<TreeviewOpen>> handler: materialize the opened folder's children."""
+        iid = self.tree.focus()
+        if iid:
+            self._populate_folder(iid)
+
+    def _ensure_fully_populated(self) -> None:
+        """
+        Materialize every deferred subtree. Whole-tree operations (search,
+        extension filtering, expand-all, snapshot save) need all rows to
+        exist; after this runs the tree is equivalent to an eager build.
+        """
+        while self._pending_subtrees:
+            for iid in list(self._pending_subtrees):
+                self._populate_folder(iid)
 
-    def _should_show_dir(self, dirname: str) -> bool:
+    def _should_show_dir(self, dirname: str, show_excluded: Optional[bool] = None) -> bool:
         """
         Return whether this directory should be displayed, i.e. if
         show_excluded is True or the directory name is not in the
         excluded set.
+
+        Callers looping over many subfolders read the show_excluded Tk
+        variable once and pass it in, so the per-directory cost is a
+        frozenset membership test instead of a Tcl round-trip.
         """
-        if self.show_excluded.get():
+        if show_excluded is None:
+            show_excluded = self.show_excluded.get()
+        if show_excluded:
             return True
-        # Use the same excludes set that was passed to the tools
-        excluded_dirs = getattr(self, "active_excludes", set(DEFAULT_EXCLUDE_DIRS))
+        # Use the same excludes set that was passed to the tools. An empty
+        # active_excludes is a real choice (user disabled the default
+        # excludes), so only fall back when the attribute is absent.
+        excluded_dirs = getattr(self, "active_excludes", None)
+        if excluded_dirs is None:
+            excluded_dirs = DEFAULT_EXCLUDE_DIRS
         return dirname not in excluded_dirs
 
     ################################################
@@ -1697,32 +2057,43 @@ class ToolRunnerUI(tk.Tk):
         path = os.path.join(self.output_dir_entry.get(), struct_file)
         if os.path.exists(path):
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    structure: Dict[str, Any] = json.load(f)
+                structure: Dict[str, Any] = self._load_structure_cached(path)
+                # Same redraw suppression as load_and_display_structure.
+                self.tree["displaycolumns"] = ()
                 self.tree.delete(*self.tree.get_children())
                 # Clear path mapping
                 self._tree_item_paths.clear()
+                self._item_ext.clear()
+                self._item_text.clear()
+                self._raw_name.clear()
+                self._highlighted.clear()
+                self._pending_subtrees.clear()
+                self._last_search_query = None
                 
                 # Get project root for building absolute paths
                 project_root = self.dir_entry.get().strip()
                 if not project_root or not os.path.isdir(project_root):
                     project_root = ""
 
-                top_keys = sorted(structure.keys())
-                if len(top_keys) == 1:
-                    root_name = top_keys[0]
+                if len(structure) == 1:
+                    root_name = next(iter(structure))
                     # Use project_root directly since it already points to the root folder
                     self._build_tree_ascii("", structure[root_name], [], root_name, project_root)
                 else:
-                    for key in top_keys:
+                    for key in sorted(structure):
                         key_path = os.path.join(project_root, key) if project_root else key
                         self._build_tree_ascii("", structure[key], [], key, key_path)
             except Exception as e:
                 self._append_log_line("ERROR", f"Error refreshing tree: {str(e)}")
+            finally:
+                self.update_displaycolumns()
 
         # Apply file-type filter
         file_type = self.file_types.get()
         if file_type != 'All':
+            # Filtering walks every row, so deferred subtrees must exist
+            # (a stub child would also make an empty folder look non-empty).
+            self._ensure_fully_populated()
             self._filter_tree_nodes(self.tree.get_children(''), file_type)
 
     ################################################
@@ -1738,23 +2109,32 @@ class ToolRunnerUI(tk.Tk):
             self._append_log_line("WARNING", "No structure file to copy from.")
             return
 
-        with open(struct_file, 'r', encoding='utf-8') as f:
-            data: Dict[str, Any] = json.load(f)
+        data: Dict[str, Any] = self._load_structure_cached(struct_file)
 
-        lines: List[str] = []
+        # Lines are written straight into one string buffer, so the export
+        # never materializes a per-line list alongside the joined text.
+        buf = io.StringIO()
         visible_cols = self.tree["displaycolumns"]  # e.g. ('size', 'created')
+        # Membership is resolved once here; the walk below tests plain bools
+        # instead of scanning the columns tuple three times per file.
+        col_flags = (
+            "size" in visible_cols,
+            "created" in visible_cols,
+            "modified" in visible_cols,
+        )
 
         # If there's exactly one root, treat that as the name. Otherwise, multiple roots
-        top_keys = sorted(data.keys())
-        if len(top_keys) == 1:
-            root_name = top_keys[0]
-            self._ascii_export_folder(folder_name=root_name, data=data[root_name], ancestors=[], lines=lines, visible_cols=visible_cols)
+        if len(data) == 1:
+            root_name = next(iter(data))
+            self._ascii_export_folder(folder_name=root_name, data=data[root_name], ancestors=(), buf=buf, col_flags=col_flags)
         else:
             # multiple top-level
-            for key in top_keys:
-                self._ascii_export_folder(folder_name=key, data=data[key], ancestors=[], lines=lines, visible_cols=visible_cols)
+            for key in sorted(data):
+                self._ascii_export_folder(folder_name=key, data=data[key], ancestors=(), buf=buf, col_flags=col_flags)
 
-        tree_text = "\n".join(lines)
+        tree_text = buf.getvalue()
+        if tree_text.endswith("\n"):
+            tree_text = tree_text[:-1]
         self.clipboard_clear()
         self.clipboard_append(tree_text)
         self._append_log_line("INFO", "Tree structure (filtered by visible columns) copied to clipboard!")
@@ -1763,9 +2143,10 @@ class ToolRunnerUI(tk.Tk):
         self,
         folder_name: str,
         data: Dict[str, Any],
-        ancestors: List[bool],
-        lines: List[str],
-        visible_cols: Tuple[str, ...]
+        ancestors: Tuple[bool, ...],
+        buf: io.StringIO,
+        col_flags: Tuple[bool, bool, bool],
+        show_excluded: Optional[bool] = None
     ) -> None:
         """
         Insert the subfolder name exactly once, then recursively
@@ -1773,46 +2154,28 @@ class ToolRunnerUI(tk.Tk):
         so we do not double-insert subfolder names.
 
         For folders, if "size" is visible, we append "X files" in parentheses,
-        where X is the total file count in the subtree.
+        where X is the total file count in the subtree. Each line is written
+        to ``buf`` with a trailing newline.
         """
-        prefix_parts: List[str] = []
-        for ancestor_last in ancestors[:-1]:
-            prefix_parts.append("    " if ancestor_last else "│   ")
-        if ancestors:
-            prefix_parts.append("└── " if ancestors[-1] else "├── ")
-        ascii_prefix = "".join(prefix_parts)
+        ascii_prefix = _folder_prefix(ancestors)
 
         # If 'size' is visible, we show "X files" in parentheses for the folder
         folder_line = f"{ascii_prefix}{folder_name}"
-        if "size" in visible_cols:
+        if col_flags[0]:
             folder_files_count = self._count_files_in_tree(data)
             folder_line += f" ({folder_files_count} files)"
 
-        lines.append(folder_line)
+        buf.write(folder_line)
+        buf.write("\n")
 
-        subfolders: Dict[str, Any] = data.get("subfolders", {})
-        files: List[Union[str, Dict[str, Any]]] = data.get("files", [])
-
-        children: List[Tuple[Any, str, Optional[Dict[str, Any]]]] = []
-        for sf_name, sf_data in subfolders.items():
-            if self._should_show_dir(sf_name):
-                children.append((sf_name, "folder", sf_data))
-        for f_item in files:
-            if isinstance(f_item, dict) and "name" in f_item:
-                children.append((f_item, "fileobj", None))
-            else:
-                children.append((f_item, "file", None))
-
-        def get_key(ch: Tuple[Any, str, Optional[Dict[str, Any]]]) -> str:
-            name, kind, _ = ch
-            if kind == "folder":
-                return str(name).lower()
-            elif kind == "fileobj":
-                return str(name["name"]).lower()
-            else:
-                return str(name).lower()
-
-        children.sort(key=get_key)
+        # Shares the per-node sorted-children cache with the Treeview build;
+        # the excluded-dirs filter is applied at use time, as there.
+        if show_excluded is None:
+            show_excluded = self.show_excluded.get()
+        children = [
+            ch for ch in self._node_sorted_children(data)
+            if ch[1] != "folder" or self._should_show_dir(str(ch[0]), show_excluded)
+        ]
 
         for i, (child, kind, subdata) in enumerate(children):
             is_last_child = (i == len(children) - 1)
@@ -1821,53 +2184,51 @@ class ToolRunnerUI(tk.Tk):
                 self._ascii_export_folder(
                     folder_name=str(child),
                     data=subdata,
-                    ancestors=ancestors + [is_last_child],
-                    lines=lines,
-                    visible_cols=visible_cols
+                    ancestors=ancestors + (is_last_child,),
+                    buf=buf,
+                    col_flags=col_flags,
+                    show_excluded=show_excluded
                 )
             elif kind == "fileobj":
                 fname = str(child.get("name", "unknown"))
                 size_val = child.get("size", None)
                 created_val = child.get("created", None)
                 mod_val = child.get("modified", None)
-                lines.append(self._ascii_export_file(
+                buf.write(self._ascii_export_file(
                     name=fname,
                     fileinfo=(size_val, created_val, mod_val),
-                    ancestors=ancestors + [is_last_child],
-                    visible_cols=visible_cols
+                    ancestors=ancestors + (is_last_child,),
+                    col_flags=col_flags
                 ))
+                buf.write("\n")
             else:
                 fname = str(child)
-                lines.append(self._ascii_export_file(
+                buf.write(self._ascii_export_file(
                     name=fname,
                     fileinfo=None,
-                    ancestors=ancestors + [is_last_child],
-                    visible_cols=visible_cols
+                    ancestors=ancestors + (is_last_child,),
+                    col_flags=col_flags
                 ))
+                buf.write("\n")
 
     def _ascii_export_file(
         self,
         name: str,
         fileinfo: Optional[Tuple[Any, Any, Any]],
-        ancestors: List[bool],
-        visible_cols: Tuple[str, ...]
+        ancestors: Tuple[bool, ...],
+        col_flags: Tuple[bool, bool, bool]
     ) -> str:
         """
         Build a single ASCII line for a file, including parentheses
-        for only the columns in visible_cols.
+        for only the visible columns.
 
         Args:
             name: The file name.
             fileinfo: (size, created, modified) if available.
-            ancestors: Bool list used for indentation.
-            visible_cols: Which columns are visible (size, created, modified).
+            ancestors: Bool tuple used for indentation.
+            col_flags: (size, created, modified) column visibility booleans.
         """
-        prefix_parts: List[str] = []
-        for ancestor_last in ancestors[:-1]:
-            prefix_parts.append("    " if ancestor_last else "│   ")
-        if ancestors:
-            prefix_parts.append("└── " if ancestors[-1] else "├── ")
-        ascii_prefix = "".join(prefix_parts)
+        ascii_prefix = _folder_prefix(ancestors)
 
         if not fileinfo:
             # plain string or missing metadata
@@ -1875,11 +2236,11 @@ class ToolRunnerUI(tk.Tk):
 
         (size_val, created_val, mod_val) = fileinfo
         extras: List[str] = []
-        if "size" in visible_cols and size_val is not None:
+        if col_flags[0] and size_val is not None:
             extras.append(f"{size_val} bytes")
-        if "created" in visible_cols and created_val:
+        if col_flags[1] and created_val:
             extras.append(str(created_val))
-        if "modified" in visible_cols and mod_val:
+        if col_flags[2] and mod_val:
             extras.append(str(mod_val))
 
         if extras:
@@ -1897,11 +2258,12 @@ class ToolRunnerUI(tk.Tk):
         Args:
             expand: True to expand all, False to collapse all.
         """
-        def _toggle(nodes: Tuple[str, ...]) -> None:
-            for nd in nodes:
-                self.tree.item(nd, open=expand)
-                _toggle(self.tree.get_children(nd))
-        _toggle(self.tree.get_children())
+        if expand:
+            # Programmatic opens do not fire <<TreeviewOpen>>, so deferred
+            # subtrees must be materialized before everything is opened.
+            self._ensure_fully_populated()
+        for nd in self._iter_all_iids():
+            self.tree.item(nd, open=expand)
 
     ################################################
     # Filter / Search
@@ -1920,66 +2282,104 @@ class ToolRunnerUI(tk.Tk):
         Detach any file nodes that do not match the chosen extension.
         Also remove empty folders.
         Returns a list of node IDs that remain visible.
+
+        File nodes and their extensions come from the Python-side
+        ``self._item_ext`` map filled during tree building, so each node
+        costs one dict lookup instead of fetching its text and tags back
+        from Tcl and stripping the ASCII prefix.
         """
         kept: List[str] = []
+        to_detach: List[str] = []
+        item_ext = self._item_ext
         for nd in nodes:
-            txt = self.tree.item(nd, 'text')
-            is_file = ('file' in self.tree.item(nd, 'tags'))
-
-            # Remove ASCII symbols from the front
-            for sym in ["├──", "└──", "│   "]:
-                txt = txt.replace(sym, "")
-            txt = txt.strip()
-
-            if is_file:
-                if not txt.endswith(file_type):
-                    self.tree.detach(nd)
+            ext = item_ext.get(nd)
+            if ext is not None:
+                # File node: keep only matching extensions.
+                if ext != file_type:
+                    to_detach.append(nd)
                 else:
                     kept.append(nd)
             else:
                 kids = self._filter_tree_nodes(self.tree.get_children(nd), file_type)
                 if not kids and not self.tree.get_children(nd):
-                    self.tree.detach(nd)
+                    to_detach.append(nd)
                 else:
                     kept.append(nd)
+        # One varargs call per level: each detach is a widget update, so
+        # batching them matters more than anything else in this walk.
+        if to_detach:
+            self.tree.detach(*to_detach)
         return [n for n in kept if self.tree.exists(n)]
 
     ################################################
     # Searching
     ################################################
+    def _schedule_search(self, event: Optional[tk.Event] = None) -> None:
+        """
+        Debounced KeyRelease handler for the search box.
+
+        Each keystroke cancels any pending search and re-arms a short
+        ``after`` timer, so a burst of typing results in one full-tree pass
+        instead of one per key.
+        """
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self.search_tree)
+
     def search_tree(self, event: Optional[tk.Event] = None) -> None:
         """
         Search the tree for items containing the query text.
         Matching items get highlighted and expanded.
+
+        The query is matched against the Python-side ``_item_text`` map and
+        only the rows whose match state actually changed are re-tagged, so
+        refining "fo" to "foo" touches the few rows that drop out instead
+        of re-tagging every node through Tcl.
         """
+        self._search_after_id = None
         query = self.search_entry.get().lower()
-        self._search_tree_nodes(self.tree.get_children(''), query)
+        if query == self._last_search_query:
+            return
+        self._last_search_query = query
+
+        # An empty box means "no search": restore any highlighted rows and
+        # skip the walk, instead of matching every row against "".
+        if not query:
+            for nd in self._highlighted:
+                if self.tree.exists(nd):
+                    base_tag = 'file' if nd in self._item_ext else 'folder'
+                    self.tree.item(nd, tags=(base_tag,))
+            self._highlighted = set()
+            return
 
-    def _search_tree_nodes(self, nodes: Tuple[str, ...], query: str) -> None:
-        """
-        Recursively search the text of each node. If it matches,
-        highlight that node and expand ancestors.
-        """
-        for nd in nodes:
-            txt = self.tree.item(nd, 'text').lower()
-            if query in txt:
+        # Search must see every row, so lazily deferred subtrees are
+        # materialized on the first query after a (re)build.
+        self._ensure_fully_populated()
+        matches = {iid for iid, text in self._item_text.items() if query in text}
+        for nd in self._highlighted - matches:
+            if self.tree.exists(nd):
+                base_tag = 'file' if nd in self._item_ext else 'folder'
+                self.tree.item(nd, tags=(base_tag,))
+        for nd in matches - self._highlighted:
+            if self.tree.exists(nd):
                 self.tree.item(nd, tags=('highlight',))
                 self._reveal_node(nd)
-            else:
-                if 'file' in self.tree.item(nd, 'tags'):
-                    self.tree.item(nd, tags=('file',))
-                else:
-                    self.tree.item(nd, tags=('folder',))
-            self._search_tree_nodes(self.tree.get_children(nd), query)
+        self._highlighted = matches
 
     def _reveal_node(self, node: str) -> None:
         """
-        Recursively open all ancestors of this node so it's visible.
+        Open all ancestors of this node so it's visible.
+
+        Walks the parent chain with a loop (outermost first) rather than
+        recursing, so arbitrarily deep rows cannot hit the recursion limit.
         """
+        parents: List[str] = []
         parent = self.tree.parent(node)
-        if parent:
-            self._reveal_node(parent)
-            self.tree.item(parent, open=True)
+        while parent:
+            parents.append(parent)
+            parent = self.tree.parent(parent)
+        for p in reversed(parents):
+            self.tree.item(p, open=True)
 
     ################################################
     # Snapshots
@@ -1991,53 +2391,119 @@ class ToolRunnerUI(tk.Tk):
         """
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=_JSON_FILETYPES
         )
-        if file_path:
-            try:
-                struct = self._get_tree_structure(self.tree.get_children(''))
+        if not file_path:
+            return
+        # Reading the Treeview must happen on this thread; only the JSON
+        # serialization and write are offloaded. The snapshot walks every
+        # row, so deferred subtrees have to exist (and stub rows must not
+        # be mistaken for files).
+        self._ensure_fully_populated()
+        struct = self._get_tree_structure(self.tree.get_children(''))
+
+        # Snapshots are only read back by load_snapshot, so compact output is
+        # fine and skips the indenting pass; orjson serializes in C when the
+        # 'fast' extra is installed.
+        def _write() -> None:
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(struct))
+            else:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(struct, f, indent=2)
-                messagebox.showinfo("Success", f"Snapshot saved to {file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save snapshot: {str(e)}")
+                    json.dump(struct, f, separators=(",", ":"), ensure_ascii=False)
+
+        future = self._io_executor.submit(_write)
+        self._watch_snapshot_future(
+            future, lambda fut: self._on_snapshot_saved(file_path, fut.exception())
+        )
+
+    def _watch_snapshot_future(self, future, callback: Callable[[Any], None]) -> None:
+        """
+        Poll a background snapshot future from the Tk event loop and invoke
+        ``callback(future)`` on this thread once it resolves.
+
+        Everything here runs on the main thread, so completion never calls
+        ``after`` from an executor worker — off-thread Tcl calls are the
+        same bug this file removes everywhere else, and can raise
+        "main thread is not in main loop" when racing shutdown.
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.after(50, self._watch_snapshot_future, future, callback)
+
+    def _on_snapshot_saved(self, file_path: str, error: Optional[BaseException]) -> None:
+        """Report the background snapshot write; runs on the Tk main thread."""
+        if error is None:
+            messagebox.showinfo("Success", f"Snapshot saved to {file_path}")
+        else:
+            messagebox.showerror("Error", f"Failed to save snapshot: {str(error)}")
 
     def load_snapshot(self) -> None:
         """
         Load a previously saved TreeView snapshot from JSON
         and repopulate the tree with ASCII indentation.
+
+        The file read and JSON parse run on the I/O executor; the tree is
+        rebuilt on the Tk main thread once the data is ready.
         """
         file_path = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=_JSON_FILETYPES
         )
-        if file_path:
-            expand_states = self._remember_open_states()
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    structure: Dict[str, Any] = json.load(f)
-                self.tree.delete(*self.tree.get_children())
+        if not file_path:
+            return
 
-                top_keys = sorted(structure.keys())
-                if len(top_keys) == 1:
-                    root_name = top_keys[0]
-                    self._build_tree_ascii("", structure[root_name], [], root_name)
-                else:
-                    for key in top_keys:
-                        self._build_tree_ascii("", structure[key], [], key)
+        def _read() -> Dict[str, Any]:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-                messagebox.showinfo("Success", "Snapshot loaded successfully")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load snapshot: {str(e)}")
-                return
+        future = self._io_executor.submit(_read)
+        self._watch_snapshot_future(future, self._on_snapshot_loaded)
 
-            self._restore_open_states(expand_states)
+    def _on_snapshot_loaded(self, future) -> None:
+        """Rebuild the tree from a loaded snapshot; runs on the Tk main thread."""
+        expand_states = self._remember_open_states()
+        try:
+            structure: Dict[str, Any] = future.result()
+            # Same redraw suppression as load_and_display_structure.
+            self.tree["displaycolumns"] = ()
+            self.tree.delete(*self.tree.get_children())
+            self._item_ext.clear()
+            self._item_text.clear()
+            self._raw_name.clear()
+            self._highlighted.clear()
+            self._pending_subtrees.clear()
+            # Snapshot dicts never enter _json_cache, so their ids die with
+            # this rebuild; stale memo entries could collide with a later
+            # snapshot's addresses.
+            self._count_memo.clear()
+            self._last_search_query = None
+
+            if len(structure) == 1:
+                root_name = next(iter(structure))
+                self._build_tree_ascii("", structure[root_name], [], root_name)
+            else:
+                for key in sorted(structure):
+                    self._build_tree_ascii("", structure[key], [], key)
+
+            messagebox.showinfo("Success", "Snapshot loaded successfully")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load snapshot: {str(e)}")
+            return
+        finally:
+            self.update_displaycolumns()
+
+        self._restore_open_states(expand_states)
 
     def _get_tree_structure(self, nodes: Tuple[str, ...]) -> Dict[str, Any]:
         """
         Reconstruct a minimal structure from the current TreeView.
 
-        For each folder, gather its files and subfolders. For each file,
-        store it in the "files" list.
+        Top-level entries are kept as folder nodes (a stray top-level file
+        is encoded as an empty folder, as the snapshot format always has);
+        below that, children are classified once during the walk.
 
         Args:
             nodes: A tuple of node IDs at this level in the tree.
@@ -2047,41 +2513,58 @@ class ToolRunnerUI(tk.Tk):
         """
         structure: Dict[str, Any] = {}
         for nd in nodes:
-            txt = self.tree.item(nd, 'text')
-            # remove the ASCII prefix
-            for sym in ["├──", "└──", "│   "]:
-                txt = txt.replace(sym, "")
-            folder_or_file_name = txt.strip()
-
-            is_file = ('file' in self.tree.item(nd, 'tags'))
-            kids = self.tree.get_children(nd)
-
-            if is_file:
-                # It's a file, so store a minimal "files": [] structure
-                structure[folder_or_file_name] = {
-                    "files": [],
-                    "subfolders": {}
-                }
+            name = self._node_bare_name(nd)
+            if nd in self._item_ext:
+                structure[name] = {"files": [], "subfolders": {}}
             else:
-                # It's a folder, gather child structure
-                child_struct = self._get_tree_structure(kids)
-                files_list: List[str] = []
-                subfolders_dict: Dict[str, Any] = {}
-                for k, v in child_struct.items():
-                    # If the child has no subfolders, that means it's a file
-                    if v["subfolders"]:
-                        subfolders_dict[k] = v
-                    elif not v["files"]:
-                        files_list.append(k)
-                    else:
-                        files_list.append(k)
-
-                structure[folder_or_file_name] = {
+                files_list, subfolders_dict = self._collect_tree_children(
+                    self.tree.get_children(nd)
+                )
+                structure[name] = {
                     "files": files_list,
                     "subfolders": subfolders_dict
                 }
         return structure
 
+    def _node_bare_name(self, nd: str) -> str:
+        """
+        Bare (prefix-free) name for a row: recorded at insert time in
+        ``_raw_name``; stripping the ASCII art back out of the display
+        text is only a fallback.
+        """
+        name = self._raw_name.get(nd)
+        if name is None:
+            txt = self.tree.item(nd, 'text')
+            name = _ASCII_PREFIX_RE.sub("", txt).strip()
+        return name
+
+    def _collect_tree_children(
+        self, nodes: Tuple[str, ...]
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Split one level of tree rows into (files, subfolders) directly.
+
+        Each row is classified from ``_item_ext`` membership while it is
+        visited, so there is no second pass over an intermediate dict —
+        and a folder whose subtree holds only files can no longer be
+        mistaken for a file, which the old post-hoc inspection did.
+        """
+        files_list: List[str] = []
+        subfolders_dict: Dict[str, Any] = {}
+        for nd in nodes:
+            name = self._node_bare_name(nd)
+            if nd in self._item_ext:
+                files_list.append(name)
+            else:
+                sub_files, sub_folders = self._collect_tree_children(
+                    self.tree.get_children(nd)
+                )
+                subfolders_dict[name] = {
+                    "files": sub_files,
+                    "subfolders": sub_folders
+                }
+        return files_list, subfolders_dict
+
     ################################################
     # About
     ################################################
@@ -2103,7 +2586,14 @@ class ToolRunnerUI(tk.Tk):
     ################################################
     def _count_files_in_tree(self, data: Dict[str, Any]) -> int:
         """
-        Recursively count how many files are in the given folder's subtree.
+        Count how many files are in the given folder's subtree.
+
+        Counts are computed bottom-up in one pass over the subtree and
+        memoized in ``self._count_memo`` (keyed by ``id()`` of the folder
+        dicts, which stay alive inside ``_json_cache``). A tree rebuild asks
+        for the count of every folder, so without the memo the naive
+        per-folder recursion costs O(nodes * depth) for the whole rebuild;
+        with it each node is visited once.
 
         Args:
             data: A dict with "files" (list of strings or dicts)
@@ -2111,57 +2601,80 @@ class ToolRunnerUI(tk.Tk):
         Returns:
             The total number of files in this folder and its subfolders.
         """
-        total = len(data.get("files", []))
-        for sf_name, sf_data in data.get("subfolders", {}).items():
-            total += self._count_files_in_tree(sf_data)
-        return total
+        memo = self._count_memo
+        cached = memo.get(id(data))
+        if cached is not None:
+            return cached
+
+        # Pre-order walk collecting unseen nodes; children land after their
+        # parent, so a reversed sweep sees every child's count before the
+        # parent needs it.
+        order: List[Dict[str, Any]] = []
+        seen: set = set()
+        stack: List[Dict[str, Any]] = [data]
+        while stack:
+            node = stack.pop()
+            node_id = id(node)
+            if node_id in memo or node_id in seen:
+                continue
+            seen.add(node_id)
+            order.append(node)
+            subfolders = node.get("subfolders")
+            if subfolders:
+                stack.extend(subfolders.values())
+
+        for node in reversed(order):
+            files = node.get("files")
+            total = len(files) if files else 0
+            subfolders = node.get("subfolders")
+            if subfolders:
+                for sf_data in subfolders.values():
+                    total += memo[id(sf_data)]
+            memo[id(node)] = total
+        return memo[id(data)]
 
     ################################################
     # Utility: Remembering / Restoring Expansion States
     ################################################
-    def _remember_open_states(self) -> Dict[str, bool]:
+    def _iter_all_iids(self):
         """
-        Recursively record which nodes are open in the current tree,
-        using a path-based dictionary so we can restore expansions
-        after rebuilding.
+        Yield every iid in the tree with an explicit stack over
+        ``get_children``.
+        """
+        stack = list(reversed(self.tree.get_children('')))
+        while stack:
+            iid = stack.pop()
+            yield iid
+            stack.extend(reversed(self.tree.get_children(iid)))
+
+    def _remember_open_states(self) -> "set[str]":
+        """
+        Record which nodes are open in the current tree as a set of iids.
+        Tree rows carry deterministic name-path iids, so the set remains
+        valid across a rebuild; closed nodes are not stored because a
+        rebuilt tree starts fully collapsed.
 
         Returns:
-            A dict of { full_node_path: bool }, where True means
-            the node is open (expanded), False means closed.
-        """
-        states: Dict[str, bool] = {}
-        def _walk(node: str, path: str) -> None:
-            is_open = self.tree.item(node, "open")
-            states[path] = is_open
-            for child in self.tree.get_children(node):
-                child_text = self.tree.item(child, "text")
-                subpath = path + "/" + child_text
-                _walk(child, subpath)
-        # Walk each child of root
-        for root_child in self.tree.get_children(''):
-            root_text = self.tree.item(root_child, "text")
-            _walk(root_child, root_text)
-        return states
-
-    def _restore_open_states(self, states: Dict[str, bool]) -> None:
-        """
-        Given a dict of expansions { full_node_path: bool }, traverse
-        the newly built tree, matching each node's path. If found in states,
-        set the open/closed accordingly.
+            The set of iids for every open node.
+        """
+        return {iid for iid in self._iter_all_iids() if self.tree.item(iid, "open")}
+
+    def _restore_open_states(self, states: "set[str]") -> None:
+        """
+        Re-open the nodes whose iids are in ``states``. No tree walk:
+        deterministic iids address the rebuilt rows directly, so restoring
+        costs one Tcl call per previously open node.
 
         Args:
-            states: dict of { full_node_path: bool }
-        """
-        def _walk(node: str, path: str) -> None:
-            if path in states:
-                self.tree.item(node, open=states[path])
-            for child in self.tree.get_children(node):
-                child_text = self.tree.item(child, "text")
-                subpath = path + "/" + child_text
-                _walk(child, subpath)
-        for root_child in self.tree.get_children(''):
-            root_text = self.tree.item(root_child, "text")
-            _walk(root_child, root_text)
+            states: set of iids to re-open.
+        """
+        # Shallow paths first: opening (and populating) a parent is what
+        # brings its children's rows into existence. Programmatic opens do
+        # not fire <<TreeviewOpen>>, so populate explicitly.
+        for iid in sorted(states, key=lambda s: s.count('/')):
+            if self.tree.exists(iid):
+                self._populate_folder(iid)
+                self.tree.item(iid, open=True)
 
 
 ################################################